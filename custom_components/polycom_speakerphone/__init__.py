@@ -8,30 +8,42 @@ https://github.com/zacs/ha-polycom_speakerphone
 from __future__ import annotations
 
 from datetime import timedelta
+from functools import partial
 from typing import TYPE_CHECKING
 
 import voluptuous as vol
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import Platform
-from homeassistant.core import ServiceCall
+from homeassistant.core import callback
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.loader import async_get_loaded_integration
+from homeassistant.util import dt as dt_util
 
-from .api import PolycomApiClient
+from .api import PolycomApiClient, create_device_session, device_mac_address
+from .capabilities import async_get_capability_registry
 from .const import (
+    CONF_CAPABILITIES,
     CONF_HOST,
+    CONF_MIN_INTERVAL,
     CONF_PASSWORD,
+    CONF_PUSH,
     CONF_VERIFY_SSL,
+    CONF_WEBHOOK_ID,
+    DEFAULT_MIN_INTERVAL,
     DEFAULT_USERNAME,
     DOMAIN,
     LOGGER,
-    SERVICE_REBOOT,
 )
-from .coordinator import PolycomDataUpdateCoordinator
+from .coordinator import PolycomDataUpdateCoordinator, snapshot_store
 from .data import PolycomData
+from .fleet_status import async_get_fleet_status
+from .push import async_register_push
+from .services import async_setup_services
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
     from .data import PolycomConfigEntry
 
@@ -42,60 +54,96 @@ PLATFORMS: list[Platform] = [
     Platform.SWITCH,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: ARG001
+    """Register the services shared by all phones."""
+    async_setup_services(hass)
+    return True
+
+
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: PolycomConfigEntry,
 ) -> bool:
     """Set up this integration using UI."""
+    # Each phone gets its own keep-alive session rather than HA's shared one
+    session, connection_stats = create_device_session()
+    entry.async_on_unload(session.close)
+
     # Create API client
     client = PolycomApiClient(
         host=entry.data[CONF_HOST],
         username=DEFAULT_USERNAME,
         password=entry.data[CONF_PASSWORD],
-        session=async_get_clientsession(hass, verify_ssl=entry.data.get(CONF_VERIFY_SSL, False)),
+        session=session,
         verify_ssl=entry.data.get(CONF_VERIFY_SSL, False),
     )
     
-    # Get initial device info
-    device_info = await client.async_get_device_info()
-    network_info = await client.async_get_network_info()
-    mac_address = device_info.get("MACAddress", "").lower()
-    host = entry.data[CONF_HOST]
-    
     # Create coordinator
     coordinator = PolycomDataUpdateCoordinator(
         hass=hass,
         logger=LOGGER,
         name=DOMAIN,
-        update_interval=timedelta(seconds=30),
+        config_entry=entry,
+        update_interval=timedelta(
+            seconds=entry.options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL)
+        ),
     )
-    
+
     entry.runtime_data = PolycomData(
         client=client,
+        connection_stats=connection_stats,
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
-        device_info=device_info,
-        mac_address=mac_address,
-        host=host,
+        device_info={},
+        mac_address="",
+        host=entry.data[CONF_HOST],
     )
+    # Also run when setup fails after the first refresh reported the phone
+    entry.async_on_unload(partial(_async_leave_fleet_status, hass, entry.entry_id))
+
+    # Endpoints found missing when the phone was added are not probed again
+    if (capabilities := entry.data.get(CONF_CAPABILITIES)) is not None:
+        async_get_capability_registry(hass).seed(capabilities, dt_util.utcnow())
 
+    # Start from the last persisted snapshot when there is one, so an offline or
+    # slow phone does not hold up startup; otherwise the first refresh has to
+    # complete before we know enough about the device to create entities.
     # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-    await coordinator.async_config_entry_first_refresh()
+    device_info = await coordinator.async_restore()
+    restored = device_info is not None
+    if not restored:
+        await coordinator.async_config_entry_first_refresh()
+        device_info = coordinator.data["device_info"]
+
+    entry.runtime_data.device_info = device_info
+    entry.runtime_data.mac_address = device_mac_address(device_info)
+
+    if restored:
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            f"{DOMAIN} {entry.data[CONF_HOST]} initial refresh",
+        )
+
+    if entry.options.get(CONF_PUSH, False):
+        if CONF_WEBHOOK_ID not in entry.data:
+            # Done before the update listener is added, so it does not reload
+            hass.config_entries.async_update_entry(
+                entry,
+                data={**entry.data, CONF_WEBHOOK_ID: webhook.async_generate_id()},
+            )
+        entry.async_on_unload(async_register_push(hass, entry))
+
+    if coordinator.statistics is not None:
+        entry.async_on_unload(coordinator.statistics.async_start())
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     
-    # Register services
-    async def handle_reboot(call: ServiceCall) -> None:
-        """Handle the reboot service call."""
-        await client.async_reboot()
-        LOGGER.info("Polycom device rebooting")
-    
-    hass.services.async_register(
-        DOMAIN, SERVICE_REBOOT, handle_reboot
-    )
-
     return True
 
 
@@ -104,10 +152,43 @@ async def async_unload_entry(
     entry: PolycomConfigEntry,
 ) -> bool:
     """Handle removal of an entry."""
-    # Unregister services
-    hass.services.async_remove(DOMAIN, SERVICE_REBOOT)
-    
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
+
+    fleet_status = async_get_fleet_status(hass)
+    # A reloading host claims the fleet sensors back when it is set up again
+    if fleet_status.release_host(entry.entry_id) and entry.disabled_by is not None:
+        _async_hand_over_fleet_sensors(hass)
+    return True
+
+
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: PolycomConfigEntry,
+) -> None:
+    """Remove the persisted snapshot when an entry is deleted."""
+    await snapshot_store(hass, entry.entry_id).async_remove()
+    if async_get_fleet_status(hass).host_entry_id is None:
+        _async_hand_over_fleet_sensors(hass)
+
+
+@callback
+def _async_leave_fleet_status(hass: HomeAssistant, entry_id: str) -> None:
+    """Take a phone that is unloaded, or failed to set up, out of the counters."""
+    fleet_status = async_get_fleet_status(hass)
+    fleet_status.async_update(entry_id, None)
+    # Still the host only when setup failed; an unload has released it
+    if fleet_status.release_host(entry_id):
+        _async_hand_over_fleet_sensors(hass)
+
+
+@callback
+def _async_hand_over_fleet_sensors(hass: HomeAssistant) -> None:
+    """Reload a loaded phone so that it takes over the fleet sensors."""
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.state is ConfigEntryState.LOADED:
+            hass.config_entries.async_schedule_reload(entry.entry_id)
+            return
 
 
 async def async_reload_entry(
@@ -2,11 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
+import re
 import socket
-from typing import Any
+import time
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 import async_timeout
+from aiohttp import hdrs
+
+from .metrics import PolycomClientMetrics
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+    from types import SimpleNamespace
+
+# Endpoints returned by async_get_all_data, in the order they are reported
+ENDPOINTS = (
+    "device_info",
+    "network_info",
+    "poll_status",
+    "call_status",
+    "device_stats",
+    "line_info",
+    "session_stats",
+    "communication_info",
+)
+
+# Endpoints whose failure fails the whole refresh; the rest degrade to {}
+REQUIRED_ENDPOINTS = frozenset({"device_info", "network_info"})
+
+REQUEST_TIMEOUT = 10
+DEFAULT_ENDPOINT_TIMEOUT = 5
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+
+# Idle connections are closed on our side before the Trio's web server drops
+# them, so a reused connection is rarely one the phone has already given up on.
+KEEPALIVE_TIMEOUT = 10
+DNS_CACHE_TTL = 300
 
 
 class PolycomApiClientError(Exception):
@@ -25,6 +61,27 @@ class PolycomApiClientAuthenticationError(
     """Exception to indicate an authentication error."""
 
 
+class PolycomApiClientNotSupportedError(
+    PolycomApiClientError,
+):
+    """Exception to indicate the firmware does not implement an endpoint."""
+
+
+def normalize_mac(mac_address: str) -> str:
+    """Return a MAC address as lowercase hex digits, without separators."""
+    return re.sub(r"[^0-9a-f]", "", mac_address.lower())
+
+
+def device_mac_address(device_info: dict[str, Any]) -> str:
+    """
+    Return the MAC address reported in device_info, normalised.
+
+    Unique IDs and device identifiers are all derived through here, so a
+    phone is recognised whichever way it was added.
+    """
+    return normalize_mac(str(device_info.get("MACAddress") or ""))
+
+
 def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     """Verify that the response is valid."""
     if response.status in (401, 403):
@@ -32,19 +89,86 @@ def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
         raise PolycomApiClientAuthenticationError(
             msg,
         )
+    if response.status in (404, 405, 501):
+        msg = f"Endpoint not supported - {response.url.path}"
+        raise PolycomApiClientNotSupportedError(
+            msg,
+        )
     response.raise_for_status()
 
 
+@dataclass(slots=True)
+class _CachedResponse:
+    """Last raw body of an endpoint and what it decoded to."""
+
+    body: bytes
+    result: Any
+    etag: str | None
+
+
+@dataclass
+class PolycomConnectionStats:
+    """Connection counters for a device session."""
+
+    handshakes: int = 0
+    reused: int = 0
+
+
+def create_device_session(
+    max_connections: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+) -> tuple[aiohttp.ClientSession, PolycomConnectionStats]:
+    """
+    Create a keep-alive session dedicated to one device.
+
+    The connector holds at most ``max_connections`` connections to the phone
+    and keeps them open between polls, so most requests skip the TCP and TLS
+    handshake. Resolved hostnames are cached. Every new connection (and so
+    every TLS handshake) and every reused connection is counted in the
+    returned stats.
+    """
+    stats = PolycomConnectionStats()
+
+    async def _on_connection_create_end(
+        _session: aiohttp.ClientSession,
+        _context: SimpleNamespace,
+        _params: aiohttp.TraceConnectionCreateEndParams,
+    ) -> None:
+        stats.handshakes += 1
+
+    async def _on_connection_reuseconn(
+        _session: aiohttp.ClientSession,
+        _context: SimpleNamespace,
+        _params: aiohttp.TraceConnectionReuseconnParams,
+    ) -> None:
+        stats.reused += 1
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(_on_connection_reuseconn)
+
+    connector = aiohttp.TCPConnector(
+        limit=max_connections,
+        limit_per_host=max_connections,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+    )
+    session = aiohttp.ClientSession(connector=connector, trace_configs=[trace_config])
+    return session, stats
+
+
 class PolycomApiClient:
     """Polycom Trio 8800 API Client."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         host: str,
         username: str,
         password: str,
         session: aiohttp.ClientSession,
         verify_ssl: bool = False,
+        *,
+        endpoint_timeout: float = DEFAULT_ENDPOINT_TIMEOUT,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
     ) -> None:
         """Initialize Polycom API Client."""
         self._host = host
@@ -54,12 +178,36 @@ class PolycomApiClient:
         self._verify_ssl = verify_ssl
         self._base_url = f"https://{host}/api/v1"
         self._auth = aiohttp.BasicAuth(username, password)
+        self._endpoint_timeout = endpoint_timeout
+        self.metrics = PolycomClientMetrics()
+        # Set once the device rejects the credentials on a required endpoint
+        # or the probe; they are not retried, as repeated failed logins can
+        # lock the phone's admin account. A rejection of anything else may
+        # only mean that endpoint is locked down, and is not latched.
+        self._auth_failed = False
+        # The Trio's embedded web server copes badly with many parallel
+        # requests, so cap how many we keep in flight per device.
+        self._request_limit = asyncio.Semaphore(max_concurrent_requests)
+        # Idle phones mostly answer with the same bytes as last time; those
+        # answers are not decoded again (see _api_wrapper).
+        self._responses: dict[str, _CachedResponse] = {}
+        self._endpoint_fetchers: dict[str, Callable[[], Awaitable[Any]]] = {
+            "device_info": self.async_get_device_info,
+            "network_info": self.async_get_network_info,
+            "poll_status": self.async_poll_for_status,
+            "call_status": self.async_get_call_status,
+            "device_stats": self.async_get_device_stats,
+            "line_info": self.async_get_line_info,
+            "session_stats": self.async_get_session_stats,
+            "communication_info": self.async_get_communication_info,
+        }
 
     async def async_get_device_info(self) -> dict[str, Any]:
         """Get device information."""
         response = await self._api_wrapper(
             method="get",
             url=f"https://{self._host}/api/v2/mgmt/device/info",
+            endpoint="device_info",
         )
         return response.get("data", {})
 
@@ -68,6 +216,7 @@ class PolycomApiClient:
         response = await self._api_wrapper(
             method="get",
             url=f"{self._base_url}/mgmt/network/info",
+            endpoint="network_info",
         )
         return response.get("data", {})
 
@@ -76,6 +225,7 @@ class PolycomApiClient:
         response = await self._api_wrapper(
             method="get",
             url=f"{self._base_url}/webCallControl/callStatus",
+            endpoint="call_status",
         )
         # This endpoint may return an error status when no call is active
         return response.get("data", {})
@@ -85,6 +235,7 @@ class PolycomApiClient:
         response = await self._api_wrapper(
             method="get",
             url=f"{self._base_url}/mgmt/media/sessionStats",
+            endpoint="session_stats",
         )
         return response.get("data", {})
 
@@ -93,6 +244,7 @@ class PolycomApiClient:
         response = await self._api_wrapper(
             method="get",
             url=f"https://{self._host}/api/v2/mgmt/lineInfo",
+            endpoint="line_info",
         )
         return response.get("data", [])
 
@@ -101,6 +253,7 @@ class PolycomApiClient:
         response = await self._api_wrapper(
             method="get",
             url=f"{self._base_url}/mgmt/device/stats",
+            endpoint="device_stats",
         )
         return response.get("data", {})
 
@@ -109,14 +262,16 @@ class PolycomApiClient:
         response = await self._api_wrapper(
             method="get",
             url=f"{self._base_url}/mgmt/pollForStatus",
+            endpoint="poll_status",
         )
         return response.get("data", {})
-    
+
     async def async_get_communication_info(self) -> dict[str, Any]:
         """Get communication information including mute state."""
         response = await self._api_wrapper(
             method="get",
             url=f"{self._base_url}/mgmt/media/communicationInfo",
+            endpoint="communication_info",
         )
         return response.get("data", {})
 
@@ -125,63 +280,107 @@ class PolycomApiClient:
         return await self._api_wrapper(
             method="post",
             url=f"{self._base_url}/callctrl/mute",
+            endpoint="mute",
             data={"data": {"state": "1" if mute else "0"}},
         )
-    
+
     async def async_reboot(self) -> dict[str, Any]:
         """Reboot the device."""
         return await self._api_wrapper(
             method="post",
             url=f"{self._base_url}/mgmt/safeReboot",
+            endpoint="reboot",
         )
 
+    async def async_probe(self) -> None:
+        """
+        Check that the device answers, with a single cheap request.
+
+        Raises PolycomApiClientCommunicationError when it does not; any other
+        answer, even a rejection of the endpoint, shows that it is reachable.
+        """
+        try:
+            await self._async_fetch_endpoint("poll_status")
+        except PolycomApiClientAuthenticationError:
+            self._auth_failed = True
+            raise
+        except PolycomApiClientCommunicationError:
+            raise
+        except PolycomApiClientError:
+            return
+
     async def async_get_all_data(self) -> dict[str, Any]:
         """Get all device data at once."""
-        device_info = await self.async_get_device_info()
-        network_info = await self.async_get_network_info()
-        
-        # Use pollForStatus for fast polling of call state
-        try:
-            poll_status = await self.async_poll_for_status()
-        except Exception:  # noqa: BLE001
-            poll_status = {}
-        
-        # Try to get other data, but don't fail if endpoints don't exist
-        try:
-            call_status = await self.async_get_call_status()
-        except Exception:  # noqa: BLE001
-            call_status = {}
-        
-        try:
-            device_stats = await self.async_get_device_stats()
-        except Exception:  # noqa: BLE001
-            device_stats = {}
-        
-        try:
-            line_info = await self.async_get_line_info()
-        except Exception:  # noqa: BLE001
-            line_info = {}
-        
-        try:
-            session_stats = await self.async_get_session_stats()
-        except Exception:  # noqa: BLE001
-            session_stats = {}
-        
-        try:
-            communication_info = await self.async_get_communication_info()
-        except Exception:  # noqa: BLE001
-            communication_info = {}
-
-        return {
-            "device_info": device_info,
-            "network_info": network_info,
-            "poll_status": poll_status,
-            "call_status": call_status,
-            "device_stats": device_stats,
-            "line_info": line_info,
-            "session_stats": session_stats,
-            "communication_info": communication_info,
-        }
+        data: dict[str, Any] = {endpoint: {} for endpoint in ENDPOINTS}
+        data.update(await self.async_get_endpoints(ENDPOINTS))
+        return data
+
+    async def async_get_endpoints(
+        self,
+        endpoints: Iterable[str],
+        errors: dict[str, PolycomApiClientError] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Fetch several endpoints concurrently.
+
+        Every endpoint gets its own deadline, so one slow endpoint only costs
+        its own data. Optional endpoints that fail, time out or are refused
+        are left out of the result (and recorded in ``errors`` when given); a
+        failing required endpoint fails the whole call.
+
+        An endpoint whose answer is unchanged since it was last fetched
+        returns the very same object as then, so callers can tell the
+        sections that changed with an identity check.
+        """
+        endpoints = tuple(endpoints)
+        results = await asyncio.gather(
+            *(self._async_fetch_endpoint(endpoint) for endpoint in endpoints),
+            return_exceptions=True,
+        )
+
+        data: dict[str, Any] = {}
+        for endpoint, result in zip(endpoints, results, strict=True):
+            if isinstance(result, BaseException):
+                if (
+                    not isinstance(result, PolycomApiClientError)
+                    or endpoint in REQUIRED_ENDPOINTS
+                ):
+                    raise result
+                if errors is not None:
+                    errors[endpoint] = result
+                continue
+            data[endpoint] = result
+        return data
+
+    async def _async_fetch_endpoint(self, endpoint: str) -> Any:
+        """Fetch a single endpoint, within its deadline (see _api_wrapper)."""
+        return await self._endpoint_fetchers[endpoint]()
+
+    async def _async_decode(
+        self,
+        response: aiohttp.ClientResponse,
+        endpoint: str | None,
+    ) -> tuple[Any, int, bool]:
+        """
+        Return the decoded body, its size and whether it is unchanged.
+
+        For a named endpoint the raw body is compared with the previous one,
+        and when the bytes match (or the device answers 304 to our ETag) the
+        previously decoded object is returned without decoding it again.
+        """
+        cached = self._responses.get(endpoint) if endpoint is not None else None
+        if cached is not None and response.status == HTTPStatus.NOT_MODIFIED:
+            return cached.result, 0, True
+        _verify_response_or_raise(response)
+        body = await response.read()
+        if cached is not None and body == cached.body:
+            return cached.result, len(body), True
+        result = await response.json()
+        if endpoint is not None:
+            self._responses[endpoint] = _CachedResponse(
+                body, result, response.headers.get(hdrs.ETAG)
+            )
+        return result, len(body), False
 
     async def _api_wrapper(
         self,
@@ -189,37 +388,75 @@ class PolycomApiClient:
         url: str,
         data: dict | None = None,
         headers: dict | None = None,
+        endpoint: str = "other",
     ) -> Any:
         """Get information from the API."""
         if headers is None:
             headers = {}
         headers["Content-Type"] = "application/json"
-        
-        try:
-            async with async_timeout.timeout(10):
-                response = await self._session.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    json=data,
-                    auth=self._auth,
-                    ssl=self._verify_ssl,
-                )
-                _verify_response_or_raise(response)
-                return await response.json()
-
-        except TimeoutError as exception:
-            msg = f"Timeout error fetching information - {exception}"
-            raise PolycomApiClientCommunicationError(
-                msg,
-            ) from exception
-        except (aiohttp.ClientError, socket.gaierror) as exception:
-            msg = f"Error fetching information - {exception}"
-            raise PolycomApiClientCommunicationError(
-                msg,
-            ) from exception
-        except Exception as exception:  # pylint: disable=broad-except
-            msg = f"Something really wrong happened! - {exception}"
-            raise PolycomApiClientError(
-                msg,
-            ) from exception
+        metrics = self.metrics.endpoint(endpoint)
+        # Only reads of a named endpoint are worth remembering
+        cacheable = method == "get" and endpoint != "other"
+        cached = self._responses.get(endpoint) if cacheable else None
+        # Polled endpoints get the short per-endpoint deadline, commands more
+        deadline = self._endpoint_timeout if endpoint in ENDPOINTS else REQUEST_TIMEOUT
+        if cached is not None and cached.etag is not None:
+            headers[hdrs.IF_NONE_MATCH] = cached.etag
+        if self._auth_failed:
+            msg = "Invalid credentials (cached, not retried)"
+            raise PolycomApiClientAuthenticationError(msg)
+
+        async with self._request_limit:
+            # Measured, and the deadline started, once we hold a slot, so
+            # queueing behind the device's other requests is not counted
+            start = time.monotonic()
+            try:
+                # Leaving the response's context releases its connection on
+                # every path, including errors and 304s whose body is unread
+                async with (
+                    async_timeout.timeout(deadline),
+                    self._session.request(
+                        method=method,
+                        url=url,
+                        headers=headers,
+                        json=data,
+                        auth=self._auth,
+                        ssl=self._verify_ssl,
+                    ) as response,
+                ):
+                    result, size, unchanged = await self._async_decode(
+                        response, endpoint if cacheable else None
+                    )
+
+            except PolycomApiClientNotSupportedError:
+                metrics.record(time.monotonic() - start, error="unsupported")
+                raise
+            except PolycomApiClientAuthenticationError:
+                metrics.record(time.monotonic() - start, error="authentication")
+                if endpoint in REQUIRED_ENDPOINTS:
+                    self._auth_failed = True
+                raise
+            except PolycomApiClientError as exception:
+                metrics.record(time.monotonic() - start, error=type(exception).__name__)
+                raise
+            except TimeoutError as exception:
+                metrics.record(time.monotonic() - start, error="timeout")
+                msg = f"Timeout error fetching information - {exception}"
+                raise PolycomApiClientCommunicationError(
+                    msg,
+                ) from exception
+            except (aiohttp.ClientError, socket.gaierror) as exception:
+                metrics.record(time.monotonic() - start, error=type(exception).__name__)
+                msg = f"Error fetching information - {exception}"
+                raise PolycomApiClientCommunicationError(
+                    msg,
+                ) from exception
+            except Exception as exception:  # pylint: disable=broad-except
+                metrics.record(time.monotonic() - start, error=type(exception).__name__)
+                msg = f"Something really wrong happened! - {exception}"
+                raise PolycomApiClientError(
+                    msg,
+                ) from exception
+
+            metrics.record(time.monotonic() - start, size=size, unchanged=unchanged)
+            return result
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import (
-    BinarySensorDeviceClass,
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
@@ -19,26 +19,39 @@ if TYPE_CHECKING:
     from .coordinator import PolycomDataUpdateCoordinator
     from .data import PolycomConfigEntry
 
+
+@dataclass(frozen=True, kw_only=True)
+class PolycomBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describes a Polycom binary sensor."""
+
+    # Snapshot field the state is read from
+    field: str
+
+
 ENTITY_DESCRIPTIONS = (
-    BinarySensorEntityDescription(
+    PolycomBinarySensorEntityDescription(
         key="dnd_status",
         name="Do Not Disturb",
         icon="mdi:phone-off",
+        field="do_not_disturb",
     ),
-    BinarySensorEntityDescription(
+    PolycomBinarySensorEntityDescription(
         key="mute_status",
         name="Muted",
         icon="mdi:microphone-off",
+        field="muted",
     ),
-    BinarySensorEntityDescription(
+    PolycomBinarySensorEntityDescription(
         key="line_registered",
         name="Line Registered",
         icon="mdi:phone-check",
+        field="line_registered",
     ),
-    BinarySensorEntityDescription(
+    PolycomBinarySensorEntityDescription(
         key="line_active",
         name="Line Active",
         icon="mdi:phone-check",
+        field="line_active",
     ),
 )
 
@@ -64,45 +77,14 @@ class PolycomBinarySensor(PolycomEntity, BinarySensorEntity):
     def __init__(
         self,
         coordinator: PolycomDataUpdateCoordinator,
-        entity_description: BinarySensorEntityDescription,
+        entity_description: PolycomBinarySensorEntityDescription,
     ) -> None:
         """Initialize the binary sensor class."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, entity_description.field)
         self.entity_description = entity_description
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{entity_description.key}"
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        data = self.coordinator.data
-        key = self.entity_description.key
-        
-        if key == "dnd_status":
-            line_info = data.get("line_info", [])
-            if isinstance(line_info, list) and len(line_info) > 0:
-                dnd = line_info[0].get("DoNotDisturb", "False")
-                return dnd == "True"
-            return None
-        
-        if key == "mute_status":
-            communication_info = data.get("communication_info", {})
-            if isinstance(communication_info, dict):
-                mute_state = communication_info.get("PhoneMuteState", "False")
-                return mute_state == "True"
-            return None
-        
-        if key == "line_registered":
-            line_info = data.get("line_info", [])
-            if isinstance(line_info, list) and len(line_info) > 0:
-                reg_status = line_info[0].get("RegistrationStatus", "")
-                return reg_status.lower() == "registered"
-            return None
-        
-        if key == "line_active":
-            line_info = data.get("line_info", [])
-            if isinstance(line_info, list) and len(line_info) > 0:
-                active = line_info[0].get("Active", "False")
-                return active == "True"
-            return None
-        
-        return None
+        return self._value_fn(self.coordinator.snapshot)
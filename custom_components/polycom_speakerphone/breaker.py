@@ -0,0 +1,68 @@
+"""Per-device circuit breaker for polycom_speakerphone."""
+
+from __future__ import annotations
+
+from enum import StrEnum
+
+from .fleet import PolycomFleetScheduler
+
+# The coordinator's timer may fire up to a second before the requested time
+_SCHEDULE_SLACK = 1.0
+
+
+class BreakerState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class PolycomCircuitBreaker:
+    """
+    Stop full polls of a device that keeps failing.
+
+    While closed, every refresh polls normally. After ``failure_threshold``
+    failures in a row the breaker opens: refreshes fail fast without touching
+    the network until the retry delay has passed, then a single probe is let
+    through (half-open). An answer closes the breaker again; another failure
+    re-opens it with a longer delay. Delays grow exponentially from
+    ``base_delay`` up to ``max_delay``, with jitter.
+    """
+
+    def __init__(
+        self, failure_threshold: int, base_delay: float, max_delay: float
+    ) -> None:
+        """Initialize."""
+        self._failure_threshold = failure_threshold
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self._retry_at = 0.0
+
+    def record_success(self) -> None:
+        """Close the breaker after the device answered."""
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+
+    def record_failure(self, now: float) -> float:
+        """Count a failure and return how long to wait before trying again."""
+        self.failures += 1
+        delay = PolycomFleetScheduler.jittered(
+            min(self._base_delay * 2**self.failures, self._max_delay)
+        )
+        if (
+            self.state is BreakerState.HALF_OPEN
+            or self.failures >= self._failure_threshold
+        ):
+            self.state = BreakerState.OPEN
+            self._retry_at = now + delay
+        return delay
+
+    def allow_probe(self, now: float) -> bool:
+        """Return whether an open breaker lets a probe through now."""
+        if now + _SCHEDULE_SLACK < self._retry_at:
+            return False
+        self.state = BreakerState.HALF_OPEN
+        return True
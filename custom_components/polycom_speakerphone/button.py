@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.button import (
     ButtonDeviceClass,
@@ -14,18 +15,30 @@ from homeassistant.helpers.entity import EntityCategory
 from .entity import PolycomEntity
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .api import PolycomApiClient
     from .coordinator import PolycomDataUpdateCoordinator
     from .data import PolycomConfigEntry
 
+
+@dataclass(frozen=True, kw_only=True)
+class PolycomButtonEntityDescription(ButtonEntityDescription):
+    """Describes a Polycom button."""
+
+    press_fn: Callable[[PolycomApiClient], Awaitable[Any]]
+
+
 ENTITY_DESCRIPTIONS = (
-    ButtonEntityDescription(
+    PolycomButtonEntityDescription(
         key="reboot",
         name="Reboot",
         device_class=ButtonDeviceClass.RESTART,
         entity_category=EntityCategory.DIAGNOSTIC,
+        press_fn=lambda client: client.async_reboot(),
     ),
 )
 
@@ -48,10 +61,13 @@ async def async_setup_entry(
 class PolycomButton(PolycomEntity, ButtonEntity):
     """polycom_speakerphone Button class."""
 
+    # Buttons have no state of their own, only availability
+    _depends_on = frozenset()
+
     def __init__(
         self,
         coordinator: PolycomDataUpdateCoordinator,
-        entity_description: ButtonEntityDescription,
+        entity_description: PolycomButtonEntityDescription,
     ) -> None:
         """Initialize the button class."""
         super().__init__(coordinator)
@@ -60,8 +76,5 @@ class PolycomButton(PolycomEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        key = self.entity_description.key
-        
-        if key == "reboot":
-            client = self.coordinator.config_entry.runtime_data.client
-            await client.async_reboot()
+        client = self.coordinator.config_entry.runtime_data.client
+        await self.entity_description.press_fn(client)
@@ -0,0 +1,113 @@
+"""Endpoint capability tracking for polycom_speakerphone."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import CAPABILITY_REPROBE_INTERVAL, DOMAIN
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+
+DATA_CAPABILITIES: HassKey[PolycomCapabilityRegistry] = HassKey(
+    f"{DOMAIN}_capabilities"
+)
+
+# Endpoints whose errors depend on the phone's state rather than its firmware;
+# callStatus for instance errors whenever no call is active.
+VOLATILE_ENDPOINTS = frozenset({"call_status"})
+
+
+def capability_key(device_info: dict[str, Any]) -> str | None:
+    """Return the model/firmware key that devices share capabilities under."""
+    model_number = device_info.get("ModelNumber")
+    firmware = device_info.get("Firmware", {})
+    if isinstance(firmware, dict):
+        firmware_version = firmware.get("Application")
+    else:
+        firmware_version = device_info.get("FirmwareRelease")
+    if not model_number or not firmware_version:
+        return None
+    return f"{model_number}/{firmware_version}"
+
+
+@dataclass
+class _CapabilityRecord:
+    """Endpoints one model/firmware combination is known not to support."""
+
+    probed_at: float
+    unsupported: set[str] = field(default_factory=set)
+
+
+class PolycomCapabilityRegistry:
+    """
+    Negative cache of unsupported endpoints, shared by model and firmware.
+
+    Records expire after ``reprobe_interval`` so the endpoints get tried
+    again, which picks up features added without a firmware version bump.
+    Devices that upgrade firmware move to a new key and are probed afresh.
+    """
+
+    def __init__(self, reprobe_interval: float) -> None:
+        """Initialize."""
+        self._reprobe_interval = reprobe_interval
+        self._records: dict[str, _CapabilityRecord] = {}
+
+    def unsupported(self, key: str | None) -> frozenset[str]:
+        """Return the endpoints to skip for devices with this key."""
+        if key is None or (record := self._records.get(key)) is None:
+            return frozenset()
+        if time.monotonic() - record.probed_at > self._reprobe_interval:
+            del self._records[key]
+            return frozenset()
+        return frozenset(record.unsupported)
+
+    def record(self, key: str | None, endpoint: str, *, supported: bool) -> None:
+        """Record whether an endpoint answered on a device with this key."""
+        if key is None or endpoint in VOLATILE_ENDPOINTS:
+            return
+        record = self._records.get(key)
+        if record is None:
+            if supported:
+                return
+            record = self._records[key] = _CapabilityRecord(time.monotonic())
+        if supported:
+            record.unsupported.discard(endpoint)
+        else:
+            record.unsupported.add(endpoint)
+
+    def seed(self, fingerprint: dict[str, Any], now: datetime) -> None:
+        """
+        Load a fingerprint stored when a phone was added.
+
+        It is only used while nothing newer is known for its key and it is
+        younger than the reprobe interval, as if it had been recorded here.
+        """
+        key = fingerprint["key"]
+        if (
+            key in self._records
+            or (probed_at := dt_util.parse_datetime(fingerprint["probed_at"])) is None
+        ):
+            return
+        age = (now - probed_at).total_seconds()
+        if not 0 <= age <= self._reprobe_interval:
+            return
+        self._records[key] = _CapabilityRecord(
+            time.monotonic() - age, set(fingerprint["unsupported"])
+        )
+
+
+def async_get_capability_registry(hass: HomeAssistant) -> PolycomCapabilityRegistry:
+    """Return the registry shared by every config entry."""
+    if (registry := hass.data.get(DATA_CAPABILITIES)) is None:
+        registry = hass.data[DATA_CAPABILITIES] = PolycomCapabilityRegistry(
+            CAPABILITY_REPROBE_INTERVAL.total_seconds()
+        )
+    return registry
@@ -2,25 +2,49 @@
 
 from __future__ import annotations
 
+from ipaddress import IPv4Network, ip_network
+
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.components import webhook
+from homeassistant.core import callback
 from homeassistant.helpers import selector
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.network import NoURLAvailableError
 
 from .api import (
-    PolycomApiClient,
     PolycomApiClientAuthenticationError,
     PolycomApiClientCommunicationError,
     PolycomApiClientError,
 )
 from .const import (
+    CONF_CAPABILITIES,
     CONF_HOST,
+    CONF_IDLE_INTERVAL,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_MAX_BACKOFF,
+    CONF_MIN_INTERVAL,
     CONF_PASSWORD,
+    CONF_PUSH,
     CONF_VERIFY_SSL,
-    DEFAULT_USERNAME,
+    CONF_WEBHOOK_ID,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_MAX_BACKOFF,
+    DEFAULT_MIN_INTERVAL,
     DOMAIN,
     LOGGER,
 )
+from .discovery import MAX_DISCOVERY_HOSTS, DiscoveredPhone, async_discover_phones
+from .onboarding import (
+    async_fingerprint_capabilities,
+    async_validate_phone,
+    async_validate_phones,
+    parse_phone_list,
+)
+
+CONF_NETWORK = "network"
+CONF_PHONES = "phones"
+CONF_PHONE_LIST = "phone_list"
 
 
 class PolycomFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -28,18 +52,43 @@ class PolycomFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,  # noqa: ARG004
+    ) -> PolycomOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return PolycomOptionsFlowHandler()
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._discovery_input: dict = {}
+        self._discovered: dict[str, DiscoveredPhone] = {}
+
     async def async_step_user(
+        self,
+        user_input: dict | None = None,  # noqa: ARG002
+    ) -> config_entries.ConfigFlowResult:
+        """Let the user add phones by hand, from a list or by scanning a network."""
+        return self.async_show_menu(
+            step_id="user", menu_options=["manual", "bulk", "discover"]
+        )
+
+    async def async_step_manual(
         self,
         user_input: dict | None = None,
     ) -> config_entries.ConfigFlowResult:
-        """Handle a flow initialized by the user."""
+        """Handle a phone entered by hand."""
         _errors = {}
         if user_input is not None:
+            verify_ssl = user_input.get(CONF_VERIFY_SSL, False)
+            session = async_get_clientsession(self.hass, verify_ssl=verify_ssl)
             try:
-                device_info = await self._test_connection(
-                    host=user_input[CONF_HOST],
-                    password=user_input[CONF_PASSWORD],
-                    verify_ssl=user_input.get(CONF_VERIFY_SSL, False),
+                phone = await async_validate_phone(
+                    session,
+                    user_input[CONF_HOST],
+                    user_input[CONF_PASSWORD],
+                    verify_ssl=verify_ssl,
                 )
             except PolycomApiClientAuthenticationError as exception:
                 LOGGER.warning(exception)
@@ -52,23 +101,29 @@ class PolycomFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 _errors["base"] = "unknown"
             else:
                 # Use MAC address as unique_id
-                mac_address = device_info.get("network_info", {}).get("MACAddress", "")
-                if mac_address:
-                    await self.async_set_unique_id(mac_address.lower())
+                if phone.mac_address:
+                    await self.async_set_unique_id(phone.mac_address)
                     self._abort_if_unique_id_configured()
-                
-                # Get device name for title
-                device_name = device_info.get("device_info", {}).get("DeviceVendor", "Polycom")
-                model = device_info.get("device_info", {}).get("ModelNumber", "Unknown")
-                title = f"{device_name} {model}"
-                
+
+                data = dict(user_input)
+                try:
+                    capabilities = await async_fingerprint_capabilities(
+                        session, phone, verify_ssl=verify_ssl
+                    )
+                except PolycomApiClientError as exception:
+                    # Setup probes the endpoints itself instead
+                    LOGGER.debug("Could not fingerprint %s: %s", phone.host, exception)
+                else:
+                    if capabilities is not None:
+                        data[CONF_CAPABILITIES] = capabilities
+
                 return self.async_create_entry(
-                    title=title,
-                    data=user_input,
+                    title=phone.title,
+                    data=data,
                 )
 
         return self.async_show_form(
-            step_id="user",
+            step_id="manual",
             data_schema=vol.Schema(
                 {
                     vol.Required(
@@ -95,16 +150,303 @@ class PolycomFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             errors=_errors,
         )
 
-    async def _test_connection(self, host: str, password: str, verify_ssl: bool) -> dict:
-        """Validate the connection to the device."""
-        client = PolycomApiClient(
-            host=host,
-            username=DEFAULT_USERNAME,
-            password=password,
-            session=async_create_clientsession(self.hass, verify_ssl=verify_ssl),
-            verify_ssl=verify_ssl,
+    async def async_step_bulk(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Add a list of phones, validated together."""
+        _errors = {}
+        failures = ""
+        if user_input is not None:
+            verify_ssl = user_input.get(CONF_VERIFY_SSL, False)
+            try:
+                credentials = parse_phone_list(
+                    user_input[CONF_PHONE_LIST], user_input.get(CONF_PASSWORD)
+                )
+            except ValueError:
+                _errors[CONF_PHONE_LIST] = "invalid_phone_list"
+            else:
+                if not credentials:
+                    _errors[CONF_PHONE_LIST] = "invalid_phone_list"
+            if not _errors:
+                result = await async_validate_phones(
+                    async_get_clientsession(self.hass, verify_ssl=verify_ssl),
+                    credentials,
+                    verify_ssl=verify_ssl,
+                )
+                if result.failed:
+                    _errors["base"] = "bulk_failed"
+                    failures = ", ".join(
+                        f"{host} ({reason})" for host, reason in result.failed.items()
+                    )
+                else:
+                    configured = self._async_current_ids()
+                    entries = {
+                        phone.mac_address or phone.host: _import_data(
+                            phone.host,
+                            phone.password,
+                            phone.mac_address,
+                            phone.title,
+                            verify_ssl=verify_ssl,
+                            capabilities=phone.capabilities,
+                        )
+                        for phone in result.phones
+                        if phone.mac_address not in configured
+                    }
+                    if not entries:
+                        return self.async_abort(reason="already_configured")
+                    return await self._async_create_entries(list(entries.values()))
+
+        return self.async_show_form(
+            step_id="bulk",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_PHONE_LIST,
+                        default=(user_input or {}).get(CONF_PHONE_LIST, vol.UNDEFINED),
+                    ): selector.TextSelector(
+                        selector.TextSelectorConfig(multiline=True),
+                    ),
+                    vol.Optional(
+                        CONF_PASSWORD,
+                    ): selector.TextSelector(
+                        selector.TextSelectorConfig(
+                            type=selector.TextSelectorType.PASSWORD,
+                        ),
+                    ),
+                    vol.Optional(
+                        CONF_VERIFY_SSL,
+                        default=(user_input or {}).get(CONF_VERIFY_SSL, False),
+                    ): selector.BooleanSelector(),
+                },
+            ),
+            errors=_errors,
+            description_placeholders={"failures": failures},
         )
-        # Get device and network info to validate connection and get MAC
-        device_info = await client.async_get_device_info()
-        network_info = await client.async_get_network_info()
-        return {"device_info": device_info, "network_info": network_info}
+
+    async def async_step_discover(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Scan a network range for phones not configured yet."""
+        _errors = {}
+        if user_input is not None:
+            try:
+                network = ip_network(user_input[CONF_NETWORK].strip(), strict=False)
+            except ValueError:
+                _errors[CONF_NETWORK] = "invalid_network"
+            else:
+                if not isinstance(network, IPv4Network):
+                    _errors[CONF_NETWORK] = "invalid_network"
+                elif network.num_addresses > MAX_DISCOVERY_HOSTS:
+                    _errors[CONF_NETWORK] = "network_too_large"
+            if not _errors:
+                verify_ssl = user_input.get(CONF_VERIFY_SSL, False)
+                result = await async_discover_phones(
+                    async_get_clientsession(self.hass, verify_ssl=verify_ssl),
+                    network,
+                    user_input[CONF_PASSWORD],
+                    verify_ssl=verify_ssl,
+                    exclude=self._async_current_ids(),
+                )
+                LOGGER.debug(
+                    "Found %d new phones in %s, %d rejected the password",
+                    len(result.phones),
+                    network,
+                    len(result.rejected),
+                )
+                if result.phones:
+                    self._discovery_input = user_input
+                    self._discovered = {phone.host: phone for phone in result.phones}
+                    return await self.async_step_select()
+                _errors["base"] = "auth" if result.rejected else "no_devices"
+
+        return self.async_show_form(
+            step_id="discover",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_NETWORK,
+                        default=(user_input or {}).get(CONF_NETWORK, vol.UNDEFINED),
+                    ): selector.TextSelector(),
+                    vol.Required(
+                        CONF_PASSWORD,
+                    ): selector.TextSelector(
+                        selector.TextSelectorConfig(
+                            type=selector.TextSelectorType.PASSWORD,
+                        ),
+                    ),
+                    vol.Optional(
+                        CONF_VERIFY_SSL,
+                        default=(user_input or {}).get(CONF_VERIFY_SSL, False),
+                    ): selector.BooleanSelector(),
+                },
+            ),
+            errors=_errors,
+        )
+
+    async def async_step_select(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Add the discovered phones the user picked."""
+        _errors = {}
+        if user_input is not None and not user_input[CONF_PHONES]:
+            _errors[CONF_PHONES] = "no_phones_selected"
+        elif user_input is not None:
+            phones = [self._discovered[host] for host in user_input[CONF_PHONES]]
+            return await self._async_create_entries(
+                [
+                    _import_data(
+                        phone.host,
+                        self._discovery_input[CONF_PASSWORD],
+                        phone.mac_address,
+                        phone.title,
+                        verify_ssl=self._discovery_input.get(CONF_VERIFY_SSL, False),
+                    )
+                    for phone in phones
+                ]
+            )
+
+        return self.async_show_form(
+            step_id="select",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_PHONES, default=list(self._discovered)
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[
+                                selector.SelectOptionDict(
+                                    value=host,
+                                    label=f"{phone.title} {phone.mac_address} {host}",
+                                )
+                                for host, phone in self._discovered.items()
+                            ],
+                            multiple=True,
+                        ),
+                    ),
+                },
+            ),
+            errors=_errors,
+            description_placeholders={"count": str(len(self._discovered))},
+        )
+
+    async def async_step_import(
+        self,
+        import_data: dict,
+    ) -> config_entries.ConfigFlowResult:
+        """Create the entry of a phone that was already validated."""
+        await self.async_set_unique_id(import_data["unique_id"])
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=import_data["title"],
+            data=import_data["data"],
+        )
+
+    async def _async_create_entries(
+        self, entries: list[dict]
+    ) -> config_entries.ConfigFlowResult:
+        """Create an entry per phone from the validated import data."""
+        # A flow creates a single entry; the other phones get flows of their
+        # own, which create their entries right away.
+        for import_data in entries[1:]:
+            self.hass.async_create_task(
+                self.hass.config_entries.flow.async_init(
+                    DOMAIN,
+                    context={"source": config_entries.SOURCE_IMPORT},
+                    data=import_data,
+                )
+            )
+        return await self.async_step_import(entries[0])
+
+
+def _import_data(  # noqa: PLR0913
+    host: str,
+    password: str,
+    mac_address: str,
+    title: str,
+    *,
+    verify_ssl: bool,
+    capabilities: dict | None = None,
+) -> dict:
+    """Return what async_step_import needs to add a validated phone."""
+    data = {
+        CONF_HOST: host,
+        CONF_PASSWORD: password,
+        CONF_VERIFY_SSL: verify_ssl,
+    }
+    if capabilities is not None:
+        data[CONF_CAPABILITIES] = capabilities
+    return {"unique_id": mac_address or None, "title": title, "data": data}
+
+
+def _interval_selector(maximum: int) -> selector.NumberSelector:
+    """Return a selector for a polling interval in seconds."""
+    return selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=1,
+            max=maximum,
+            step=1,
+            unit_of_measurement="s",
+            mode=selector.NumberSelectorMode.BOX,
+        ),
+    )
+
+
+class PolycomOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow for Polycom Speakerphone."""
+
+    async def async_step_init(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Manage polling, push notifications and statistics."""
+        _errors = {}
+        if user_input is not None:
+            if user_input[CONF_MIN_INTERVAL] > user_input[CONF_IDLE_INTERVAL]:
+                _errors[CONF_IDLE_INTERVAL] = "idle_below_min"
+            else:
+                return self.async_create_entry(data=user_input)
+
+        options = user_input or self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_MIN_INTERVAL,
+                        default=options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL),
+                    ): _interval_selector(60),
+                    vol.Required(
+                        CONF_IDLE_INTERVAL,
+                        default=options.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL),
+                    ): _interval_selector(600),
+                    vol.Required(
+                        CONF_MAX_BACKOFF,
+                        default=options.get(CONF_MAX_BACKOFF, DEFAULT_MAX_BACKOFF),
+                    ): _interval_selector(3600),
+                    vol.Required(
+                        CONF_PUSH,
+                        default=options.get(CONF_PUSH, False),
+                    ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_LONG_TERM_STATISTICS,
+                        default=options.get(CONF_LONG_TERM_STATISTICS, False),
+                    ): selector.BooleanSelector(),
+                },
+            ),
+            errors=_errors,
+            description_placeholders={"push_url": self._push_url()},
+        )
+
+    def _push_url(self) -> str:
+        """Return the URL the phone should push notifications to."""
+        if (webhook_id := self.config_entry.data.get(CONF_WEBHOOK_ID)) is None:
+            return "available once push notifications are enabled"
+        try:
+            return webhook.async_generate_url(
+                self.hass, webhook_id, allow_ip=True, prefer_external=False
+            )
+        except NoURLAvailableError:
+            return webhook.async_generate_path(webhook_id)
@@ -1,5 +1,6 @@
 """Constants for polycom_speakerphone."""
 
+from datetime import timedelta
 from logging import Logger, getLogger
 
 LOGGER: Logger = getLogger(__package__)
@@ -11,9 +12,94 @@ ATTRIBUTION = "Data provided by Polycom Trio 8800 REST API"
 CONF_HOST = "host"
 CONF_PASSWORD = "password"
 CONF_VERIFY_SSL = "verify_ssl"
+CONF_WEBHOOK_ID = "webhook_id"
+# Endpoints found missing while the phone was validated, see onboarding.py
+CONF_CAPABILITIES = "capabilities"
+
+# Options
+CONF_MIN_INTERVAL = "min_interval"
+CONF_IDLE_INTERVAL = "idle_interval"
+CONF_MAX_BACKOFF = "max_backoff"
+CONF_PUSH = "push"
+CONF_LONG_TERM_STATISTICS = "long_term_statistics"
 
 # Default username for Polycom devices
 DEFAULT_USERNAME = "Polycom"
 
 # Services
 SERVICE_REBOOT = "reboot"
+
+# Polling
+# The coordinator ticks at an adaptive interval (see below) and only fetches
+# the endpoints that are due, so each endpoint is polled at most at its own rate.
+ENDPOINT_INTERVALS: dict[str, timedelta] = {
+    "poll_status": timedelta(seconds=2),
+    "communication_info": timedelta(seconds=5),
+    "call_status": timedelta(seconds=5),
+    "device_stats": timedelta(seconds=60),
+    "line_info": timedelta(seconds=60),
+    "session_stats": timedelta(seconds=60),
+    # device_info is static apart from UpTime, which is only used to spot reboots
+    "device_info": timedelta(seconds=60),
+    # Static until the phone reboots or changes firmware, both of which expire it
+    "network_info": timedelta(hours=24),
+}
+
+# Endpoints a model/firmware combination rejected are skipped for this long
+# before being probed again.
+CAPABILITY_REPROBE_INTERVAL = timedelta(hours=24)
+
+# Persisted snapshot used to bring entities up before the first live refresh
+STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 60
+
+# Fleet scheduling: how many devices may refresh at once across all entries,
+# and the fraction of each interval used as jitter to keep phases spread out.
+FLEET_MAX_CONCURRENT_REFRESHES = 8
+POLL_JITTER = 0.1
+
+# Adaptive polling: poll at the minimum interval while the phone rings, is in
+# a call or has just changed state, stretch the interval step by step while it
+# stays idle, and back off exponentially while it is unreachable. All three
+# limits are in seconds and can be changed in the integration's options.
+DEFAULT_MIN_INTERVAL = 2
+DEFAULT_IDLE_INTERVAL = 30
+DEFAULT_MAX_BACKOFF = 300
+IDLE_INTERVAL_STEP = 1.5
+STATE_CHANGE_HOLD = timedelta(seconds=30)
+
+# With push notifications enabled, polling only has to catch what the phone
+# does not push (mute, statistics) and any notifications that got lost.
+PUSH_POLL_INTERVAL = 300
+
+# Circuit breaker: after this many failed refreshes in a row the phone is only
+# probed with a single request, at the backoff interval, until it answers.
+BREAKER_FAILURE_THRESHOLD = 3
+
+# How many finished calls each phone's call history keeps
+CALL_HISTORY_SIZE = 100
+
+# Long-term statistics mode: CPU and memory samples are aggregated per hour in
+# memory and imported as external statistics a little after each hour ends.
+STATISTICS_FLUSH_SECOND = 30
+
+# Commands: switch changes within the cooldown are merged into one command,
+# which is confirmed by re-reading only the endpoints showing its result; a
+# device that has not caught up gets one more look after the delay (seconds).
+COMMAND_COOLDOWN = 0.5
+COMMAND_CONFIRM_DELAY = 1.0
+
+# Rolling reboots: defaults of the reboot service, and how often (seconds) a
+# phone is checked while waiting for it to go idle or come back.
+DEFAULT_REBOOT_CONCURRENCY = 5
+DEFAULT_REBOOT_MAX_FAILURES = 3
+DEFAULT_REBOOT_IDLE_TIMEOUT = 900
+DEFAULT_REBOOT_ONLINE_TIMEOUT = 600
+REBOOT_POLL_INTERVAL = 10
+
+# In-call media quality: sessionStats is sampled every interval (seconds)
+# while a call is active, keeping up to an hour of samples per call. Each
+# finished call's aggregates are fired as an event.
+CALL_QUALITY_SAMPLE_INTERVAL = 1
+CALL_QUALITY_SAMPLES = 3600
+EVENT_CALL_QUALITY = f"{DOMAIN}_call_quality"
@@ -2,31 +2,625 @@
 
 from __future__ import annotations
 
+import time
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import (
+    ENDPOINTS,
     PolycomApiClientAuthenticationError,
+    PolycomApiClientCommunicationError,
     PolycomApiClientError,
+    PolycomApiClientNotSupportedError,
 )
+from .breaker import BreakerState, PolycomCircuitBreaker
+from .capabilities import async_get_capability_registry, capability_key
+from .const import (
+    BREAKER_FAILURE_THRESHOLD,
+    CALL_HISTORY_SIZE,
+    CALL_QUALITY_SAMPLES,
+    CONF_CAPABILITIES,
+    CONF_IDLE_INTERVAL,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_MAX_BACKOFF,
+    CONF_MIN_INTERVAL,
+    CONF_PUSH,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_MAX_BACKOFF,
+    DEFAULT_MIN_INTERVAL,
+    DOMAIN,
+    ENDPOINT_INTERVALS,
+    EVENT_CALL_QUALITY,
+    IDLE_INTERVAL_STEP,
+    LOGGER,
+    PUSH_POLL_INTERVAL,
+    SNAPSHOT_SAVE_DELAY,
+    STATE_CHANGE_HOLD,
+    STORAGE_VERSION,
+)
+from .fleet import PRIORITY_IDLE, PRIORITY_IN_CALL, async_get_fleet_scheduler
+from .fleet_status import DeviceStatus, async_get_fleet_status
+from .history import RINGING_STATE, PolycomCallHistory
+from .quality import PolycomCallQualitySampler
+from .snapshot import PolycomSnapshot
+from .statistics import PolycomStatisticsRecorder
 
 if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+
+    from homeassistant.core import HomeAssistant
+
     from .data import PolycomConfigEntry
 
 
+def _empty_snapshot() -> dict[str, Any]:
+    """Return a snapshot with every endpoint present but empty."""
+    return {endpoint: {} for endpoint in ENDPOINTS}
+
+
+def uptime_seconds(device_info: dict[str, Any]) -> int | None:
+    """Return the uptime reported in device_info, in seconds."""
+    uptime_data = device_info.get("UpTime")
+    if not isinstance(uptime_data, dict):
+        return None
+    try:
+        days = int(uptime_data.get("Days", 0))
+        hours = int(uptime_data.get("Hours", 0))
+        minutes = int(uptime_data.get("Minutes", 0))
+        seconds = int(uptime_data.get("Seconds", 0))
+    except (ValueError, TypeError):
+        return None
+    return (days * 86400) + (hours * 3600) + (minutes * 60) + seconds
+
+
+def _in_call(state: str | None) -> bool:
+    """Return whether a pollForStatus state means ringing or in a call."""
+    return bool(state) and state != "Idle"
+
+
+def _unanswered(
+    requested: Collection[str], errors: dict[str, PolycomApiClientError]
+) -> bool:
+    """Return whether every requested endpoint failed to reach the phone."""
+    return bool(requested) and all(
+        isinstance(errors.get(endpoint), PolycomApiClientCommunicationError)
+        for endpoint in requested
+    )
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding an entry's last good snapshot."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
 class PolycomDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching data from the API."""
+    """
+    Class to manage fetching data from the API.
+
+    Each endpoint is polled on its own tier (see ``ENDPOINT_INTERVALS``) and
+    merged into the previous data; entities read the decoded ``snapshot``.
+    """
 
     config_entry: PolycomConfigEntry
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize."""
+        super().__init__(*args, **kwargs)
+        # Monotonic time at which each endpoint is next due
+        self._next_fetch: dict[str, float] = {}
+        self._capabilities = async_get_capability_registry(self.hass)
+        self._fleet = async_get_fleet_scheduler(self.hass)
+        self._fleet_status = async_get_fleet_status(self.hass)
+        options = self.config_entry.options
+        self._min_interval = options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL)
+        self._idle_interval = options.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL)
+        self._max_backoff = options.get(CONF_MAX_BACKOFF, DEFAULT_MAX_BACKOFF)
+        self._push = options.get(CONF_PUSH, False)
+        # Nominal tick interval, 0 before the first tick; update_interval adds
+        # the phase and jitter
+        self._interval = 0.0
+        self.breaker = PolycomCircuitBreaker(
+            BREAKER_FAILURE_THRESHOLD, self._min_interval, self._max_backoff
+        )
+        self._phone_state: str | None = None
+        self._state_changed_at = 0.0
+        self._uptime: int | None = None
+        # Derived once per boot, so the uptime sensor does not creep between polls
+        self.boot_time: datetime | None = None
+        self.call_history = PolycomCallHistory(CALL_HISTORY_SIZE)
+        self.call_quality = PolycomCallQualitySampler(CALL_QUALITY_SAMPLES)
+        self.statistics: PolycomStatisticsRecorder | None = None
+        if options.get(CONF_LONG_TERM_STATISTICS, False):
+            self.statistics = PolycomStatisticsRecorder(self.hass, self.config_entry)
+        self._store = snapshot_store(self.hass, self.config_entry.entry_id)
+        # A delayed save is armed and has not written yet
+        self._save_pending = False
+        self._snapshot: PolycomSnapshot | None = None
+        self._snapshot_source: dict[str, Any] | None = None
+        self._snapshot_built_from: tuple[Any, ...] | None = None
+        self._notified_snapshot: PolycomSnapshot | None = None
+        self._notified_success = True
+        # Fields changed by the update being notified; None means "everything"
+        self.changed_fields: frozenset[str] | None = None
+
+    async def async_restore(self) -> dict[str, Any] | None:
+        """
+        Restore the last persisted snapshot.
+
+        The last good snapshot, with the call history and the open statistics
+        hour, is persisted so entities can start from it while the first live
+        refresh runs in the background. Returns the device_info the snapshot
+        was taken with, or None when nothing usable was stored.
+        """
+        if not (stored := await self._store.async_load()):
+            return None
+        self.data = {**_empty_snapshot(), **stored["data"]}
+        if boot_time := stored.get("boot_time"):
+            self.boot_time = dt_util.parse_datetime(boot_time)
+        self.call_history.restore(stored.get("call_history", {}))
+        if self.statistics is not None:
+            self.statistics.restore(stored.get("statistics", {}))
+        return stored["device_info"]
+
+    def _schedule_save(self) -> None:
+        """
+        Persist the snapshot within SNAPSHOT_SAVE_DELAY.
+
+        Store.async_delay_save restarts its timer on every call, so a phone
+        whose data changes each tick, as during a call, would never be saved;
+        the timer is only armed when no save is pending.
+        """
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._snapshot_to_store, SNAPSHOT_SAVE_DELAY)
+
+    def _snapshot_to_store(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        self._save_pending = False
+        return {
+            "device_info": self.config_entry.runtime_data.device_info,
+            "data": self.data,
+            "boot_time": self.boot_time.isoformat() if self.boot_time else None,
+            "call_history": self.call_history.as_dict(),
+            "statistics": (
+                self.statistics.as_dict() if self.statistics is not None else {}
+            ),
+        }
+
+    async def async_shutdown(self) -> None:
+        """Persist the snapshot right away when the entry unloads."""
+        await super().async_shutdown()
+        if self.data is not None:
+            await self._store.async_save(self._snapshot_to_store())
+
+    @property
+    def snapshot(self) -> PolycomSnapshot:
+        """Return the decoded view of the current data."""
+        if self._snapshot is None or self._snapshot_source is not self.data:
+            self._snapshot = PolycomSnapshot(
+                self.data or {},
+                self.boot_time,
+                self.config_entry.runtime_data.client.metrics,
+                self.call_history,
+                self.call_quality.last_call,
+            )
+            self._snapshot_source = self.data
+            self._snapshot_built_from = self._snapshot_inputs()
+        return self._snapshot
+
+    def _snapshot_inputs(self) -> tuple[Any, ...]:
+        """Return what the snapshot is built from besides ``data``."""
+        metrics = self.config_entry.runtime_data.client.metrics
+        return (
+            self.boot_time,
+            metrics.latency_percentile(95),
+            metrics.failed_endpoints,
+            self.call_history.calls_today,
+            self.call_history.missed_today,
+            round(self.call_history.talk_time_today),
+            self.call_history.average_duration,
+            self.call_quality.last_call,
+        )
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """
+        Notify listeners, unless nothing they show has changed.
+
+        ``changed_fields`` tells entities which snapshot fields changed; the
+        same changes are reported to the fleet status counters.
+        """
+        snapshot = self.snapshot
+        if (
+            self._notified_snapshot is None
+            or self.last_update_success != self._notified_success
+        ):
+            self.changed_fields = None
+        elif snapshot is self._notified_snapshot:
+            return
+        else:
+            self.changed_fields = snapshot.changed_fields(self._notified_snapshot)
+            if not self.changed_fields:
+                return
+        self._notified_snapshot = snapshot
+        self._notified_success = self.last_update_success
+        self._fleet_status.async_update(
+            self.config_entry.entry_id,
+            DeviceStatus.from_snapshot(snapshot, online=self.last_update_success),
+        )
+        super().async_update_listeners()
+
+    def expire_endpoints(self, *endpoints: str) -> None:
+        """Make the given endpoints due on the next refresh."""
+        for endpoint in endpoints:
+            self._next_fetch.pop(endpoint, None)
+
+    async def async_refresh_endpoints(
+        self,
+        endpoints: Iterable[str],
+        errors: dict[str, PolycomApiClientError] | None = None,
+    ) -> None:
+        """
+        Fetch just the named endpoints now and merge them into the data.
+
+        The fetch goes through the breaker and the fleet scheduler like a
+        regular refresh. The named endpoints are then not due again for a
+        full interval of their own, and the tick interval follows the
+        phone's state; the other endpoints keep their schedule. Only
+        entities reading a field that changed are updated.
+
+        Client errors are raised to the caller, as is the breaker refusing
+        to contact an unreachable phone; optional endpoints that fail keep
+        their last value and are recorded in ``errors`` when given. Before
+        the first refresh only the named endpoints are filled in; the rest
+        follow on the next tick.
+        """
+        endpoints = set(endpoints)
+        if unknown := endpoints - set(ENDPOINTS):
+            msg = f"Unknown endpoints: {', '.join(sorted(unknown))}"
+            raise ValueError(msg)
+        now = time.monotonic()
+        if self.breaker.state is not BreakerState.CLOSED:
+            await self._async_probe(now)
+
+        for endpoint in endpoints:
+            self._schedule(endpoint, now)
+        if errors is None:
+            errors = {}
+        priority = PRIORITY_IN_CALL if self.in_call else PRIORITY_IDLE
+        async with self._fleet.slot(priority):
+            fresh = await self.config_entry.runtime_data.client.async_get_endpoints(
+                endpoints, errors
+            )
+        if _unanswered(endpoints, errors):
+            self._back_off(now)
+            self.last_update_success = False
+            self.async_update_listeners()
+            raise next(iter(errors.values()))
+
+        self.breaker.record_success()
+        data = self._merge(endpoints, fresh, errors)
+        self._adapt_interval(data, now)
+        if data is not self.data:
+            self._schedule_save()
+        self.data = data
+        self.last_update_success = True
+        self.async_update_listeners()
+
+    @property
+    def capability_key(self) -> str | None:
+        """Return the model/firmware key this device shares capabilities under."""
+        if self.data is not None and self.data["device_info"]:
+            return capability_key(self.data["device_info"])
+        if (key := capability_key(self.config_entry.runtime_data.device_info)) is None:
+            # Before the first refresh, the key seen when the phone was added
+            key = self.config_entry.data.get(CONF_CAPABILITIES, {}).get("key")
+        return key
+
+    @property
+    def in_call(self) -> bool:
+        """Return whether the phone is ringing or in a call."""
+        return self.data is not None and _in_call(self.data["poll_status"].get("State"))
+
+    def _schedule(self, endpoint: str, now: float) -> None:
+        """Set when an endpoint is next due."""
+        interval = ENDPOINT_INTERVALS[endpoint].total_seconds()
+        if endpoint in self._next_fetch:
+            delay = self._fleet.jittered(interval)
+        else:
+            delay = self._fleet.first_delay(interval)
+        self._next_fetch[endpoint] = now + delay
+
+    def _due_endpoints(self, now: float) -> list[str]:
+        """Return the endpoints that should be fetched at ``now``."""
+        unsupported = self._capabilities.unsupported(self.capability_key)
+        return [
+            endpoint
+            for endpoint in ENDPOINTS
+            if self._next_fetch.get(endpoint, 0) <= now and endpoint not in unsupported
+        ]
+
     async def _async_update_data(self) -> Any:
-        """Update data via library."""
+        """
+        Fetch the endpoints that are due and merge them into the data.
+
+        Endpoints the model/firmware is known not to support are skipped, and
+        the fetch holds a fleet scheduler slot, which serves phones in a call
+        first. A phone that keeps failing trips the breaker; ticks then only
+        send a single cheap probe at the backoff interval until it answers.
+        """
+        now = time.monotonic()
+        if self.breaker.state is not BreakerState.CLOSED:
+            try:
+                await self._async_probe(now)
+            except PolycomApiClientAuthenticationError as exception:
+                raise ConfigEntryAuthFailed(exception) from exception
+            except PolycomApiClientError as exception:
+                raise UpdateFailed(exception) from exception
+
+        due = self._due_endpoints(now)
+        if not due and self.data is not None:
+            return self.data
+
+        # Reserve the endpoints up front so an overlapping refresh skips them
+        for endpoint in due:
+            self._schedule(endpoint, now)
+
+        priority = PRIORITY_IN_CALL if self.in_call else PRIORITY_IDLE
+        errors: dict[str, PolycomApiClientError] = {}
         try:
-            return await self.config_entry.runtime_data.client.async_get_all_data()
+            async with self._fleet.slot(priority):
+                fresh = await self.config_entry.runtime_data.client.async_get_endpoints(
+                    due, errors
+                )
         except PolycomApiClientAuthenticationError as exception:
+            self.expire_endpoints(*due)
+            self.call_quality.pause()
             raise ConfigEntryAuthFailed(exception) from exception
         except PolycomApiClientError as exception:
+            self.expire_endpoints(*due)
+            self._back_off(now)
             raise UpdateFailed(exception) from exception
+        if _unanswered(due, errors):
+            # Only optional endpoints were due, and none of them answered
+            self.expire_endpoints(*due)
+            self._back_off(now)
+            exception = errors[due[0]]
+            raise UpdateFailed(exception) from exception
+
+        self.breaker.record_success()
+        data = self._merge(due, fresh, errors)
+        self._adapt_interval(data, now)
+        if data is not self.data:
+            self._schedule_save()
+        return data
+
+    def _merge(
+        self,
+        requested: Iterable[str],
+        fresh: dict[str, Any],
+        errors: dict[str, PolycomApiClientError],
+    ) -> dict[str, Any]:
+        """
+        Process freshly fetched endpoints and merge them into the data.
+
+        Answers byte-for-byte the same as before come back from the client as
+        the same objects and are not merged. When nothing changed the data is
+        kept, and so is the snapshot unless the request metrics or call
+        statistics it shows moved on.
+        """
+        key = capability_key(fresh["device_info"]) if "device_info" in fresh else None
+        key = key or self.capability_key
+        for endpoint in requested:
+            if endpoint in fresh:
+                self._capabilities.record(key, endpoint, supported=True)
+            elif isinstance(errors.get(endpoint), PolycomApiClientNotSupportedError):
+                self._capabilities.record(key, endpoint, supported=False)
+
+        # An unchanged sample is still a sample
+        if self.statistics is not None and "device_stats" in fresh:
+            self.statistics.add_device_stats(fresh["device_stats"], dt_util.utcnow())
+
+        # The client hands back the same object for an unchanged answer
+        if self.data is not None:
+            fresh = {
+                endpoint: payload
+                for endpoint, payload in fresh.items()
+                if payload is not self.data.get(endpoint)
+            }
+
+        if "device_info" in fresh:
+            self._process_device_info(fresh["device_info"])
+
+        if self.data is not None and not fresh:
+            # Nothing changed: keep the data, and with it the snapshot
+            data = self.data
+        else:
+            # Endpoints that were not fetched, or failed, keep their last value
+            data = dict(self.data) if self.data is not None else _empty_snapshot()
+            data.update(fresh)
+        self._observe_call(data["poll_status"].get("State"))
+        if data is self.data and self._snapshot_inputs() != self._snapshot_built_from:
+            # Request metrics or call statistics moved on, e.g. an endpoint
+            # started failing while every answer stayed the same
+            self._snapshot = None
+        return data
+
+    def _observe_call(self, state: str | None) -> None:
+        """Follow calls starting and ending for the history and quality."""
+        now = dt_util.now()
+        self.call_history.observe(state, now)
+        if not state:
+            return
+        if not _in_call(state):
+            if (quality := self.call_quality.finish(now)) is not None:
+                self.hass.bus.async_fire(
+                    EVENT_CALL_QUALITY,
+                    {
+                        "entry_id": self.config_entry.entry_id,
+                        "name": self.config_entry.title,
+                        "mac_address": self.config_entry.runtime_data.mac_address,
+                        **quality.as_dict(),
+                    },
+                )
+        elif (
+            state != RINGING_STATE
+            and self.call_quality.needs_sampler
+            and self._may_sample_call_quality()
+        ):
+            # Media flows once the call is up
+            self.call_quality.start(
+                self.config_entry.async_create_background_task(
+                    self.hass,
+                    self.call_quality.async_sample(
+                        self.config_entry.runtime_data.client,
+                        self._may_sample_call_quality,
+                    ),
+                    f"{DOMAIN} {self.config_entry.title} call quality",
+                )
+            )
+
+    def _may_sample_call_quality(self) -> bool:
+        """Return whether sessionStats may be sampled at the moment."""
+        return (
+            self.breaker.state is BreakerState.CLOSED
+            and "session_stats"
+            not in self._capabilities.unsupported(self.capability_key)
+        )
+
+    def _adapt_interval(self, data: dict[str, Any], now: float) -> None:
+        """
+        Pick the next tick interval from the phone's state.
+
+        The tick stays at the minimum interval while the phone rings, is in a
+        call or has just changed state, and grows step by step towards the
+        idle interval while it stays idle. With push enabled it drops to a
+        slow safety net; an unreachable phone is backed off by ``_back_off``.
+        """
+        state = data["poll_status"].get("State")
+        if state != self._phone_state:
+            self._phone_state = state
+            self._state_changed_at = now
+
+        current = self._interval
+        if self._push:
+            interval = PUSH_POLL_INTERVAL
+        elif (
+            _in_call(state)
+            or now - self._state_changed_at < STATE_CHANGE_HOLD.total_seconds()
+        ):
+            interval = self._min_interval
+        else:
+            interval = min(
+                max(current, self._min_interval) * IDLE_INTERVAL_STEP,
+                self._idle_interval,
+            )
+        if not self._interval:
+            # Give the first tick its own phase within the interval, so phones
+            # set up together do not fire in the same instant of every interval
+            delay = self._fleet.first_delay(interval)
+        else:
+            delay = self._fleet.jittered(interval)
+        self._interval = interval
+        self.update_interval = timedelta(seconds=delay)
+
+    @callback
+    def async_apply_push(self, poll_status: dict[str, Any]) -> None:
+        """Apply a pushed pollForStatus update straight away."""
+        if self.data is None:
+            return
+        data = dict(self.data)
+        data["poll_status"] = {**data["poll_status"], **poll_status}
+        self._phone_state = poll_status["State"]
+        self._state_changed_at = time.monotonic()
+        self._observe_call(poll_status["State"])
+        self.async_set_updated_data(data)
+
+        # Pick up the details of the call (caller, mute) on a debounced refresh
+        self.expire_endpoints("call_status", "communication_info", "session_stats")
+        self.hass.async_create_task(self.async_request_refresh())
+
+    async def _async_probe(self, now: float) -> None:
+        """
+        Check with a single request whether an unreachable phone is back.
+
+        Raises PolycomApiClientCommunicationError while the phone is still
+        unreachable, or too soon to probe it again.
+        """
+        if not self.breaker.allow_probe(now):
+            msg = "Device is unreachable, waiting before probing it again"
+            raise PolycomApiClientCommunicationError(msg)
+        try:
+            async with self._fleet.slot(PRIORITY_IDLE):
+                await self.config_entry.runtime_data.client.async_probe()
+        except PolycomApiClientCommunicationError:
+            self._back_off(now)
+            raise
+        LOGGER.debug("%s answered the probe, resuming polls", self.config_entry.title)
+        self.breaker.record_success()
+
+    def _back_off(self, now: float) -> None:
+        """Stretch the tick interval while the phone is unreachable."""
+        # Resumed by the next refresh that finds the phone still in the call
+        self.call_quality.pause()
+        delay = self.breaker.record_failure(now)
+        self.update_interval = timedelta(seconds=delay)
+
+    def _process_device_info(self, device_info: dict[str, Any]) -> None:
+        """
+        Track reboots and firmware changes from a fresh device_info.
+
+        network_info is static, so it is only re-read once a reboot (uptime
+        going backwards) or a firmware change is seen.
+        """
+        runtime_data = self.config_entry.runtime_data
+        uptime = uptime_seconds(device_info)
+        rebooted = (
+            uptime is not None and self._uptime is not None and uptime < self._uptime
+        )
+        if uptime is not None:
+            # The first reading after startup replaces any restored boot time
+            if uptime > 0 and (rebooted or self._uptime is None):
+                self.boot_time = (dt_util.now() - timedelta(seconds=uptime)).replace(
+                    microsecond=0
+                )
+            self._uptime = uptime
+
+        previous_key = capability_key(runtime_data.device_info)
+        firmware_changed = previous_key is not None and previous_key != capability_key(
+            device_info
+        )
+        if not runtime_data.device_info:
+            runtime_data.device_info = device_info
+        if rebooted or firmware_changed:
+            LOGGER.debug(
+                "%s rebooted or changed firmware, refreshing static data",
+                runtime_data.host,
+            )
+            self.expire_endpoints("network_info")
+        if firmware_changed:
+            runtime_data.device_info = device_info
+            self._update_device_registry(device_info)
+
+    def _update_device_registry(self, device_info: dict[str, Any]) -> None:
+        """Push a new firmware version to the device registry."""
+        device_registry = dr.async_get(self.hass)
+        device = device_registry.async_get_device(
+            identifiers={(DOMAIN, self.config_entry.runtime_data.mac_address)}
+        )
+        if device is None:
+            return
+        firmware = device_info.get("Firmware", {})
+        if isinstance(firmware, dict):
+            firmware_version = firmware.get("Application", "Unknown")
+        else:
+            firmware_version = device_info.get("FirmwareRelease", "Unknown")
+        device_registry.async_update_device(device.id, sw_version=firmware_version)
@@ -9,7 +9,7 @@ if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.loader import Integration
 
-    from .api import PolycomApiClient
+    from .api import PolycomApiClient, PolycomConnectionStats
     from .coordinator import PolycomDataUpdateCoordinator
 
 
@@ -21,6 +21,7 @@ class PolycomData:
     """Data for the Polycom integration."""
 
     client: PolycomApiClient
+    connection_stats: PolycomConnectionStats
     coordinator: PolycomDataUpdateCoordinator
     integration: Integration
     device_info: dict
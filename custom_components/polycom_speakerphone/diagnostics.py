@@ -0,0 +1,81 @@
+"""Diagnostics support for polycom_speakerphone."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+
+from .capabilities import async_get_capability_registry
+from .const import CONF_HOST, CONF_PASSWORD, CONF_WEBHOOK_ID
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import PolycomConfigEntry
+
+# Diagnostics end up attached to public issues: credentials, and anything
+# locating or identifying the phone or its network, are left out
+TO_REDACT = {
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_WEBHOOK_ID,
+    "MACAddress",
+    "SerialNumber",
+    "IPV4Address",
+    "IPV6Address",
+    "SubnetMask",
+    "DefaultGateway",
+    "DHCPServer",
+    "DNSServer",
+    "AlternateDNSServer",
+    "DNSDomain",
+    "ProvServerAddress",
+    "LastCalledNumber",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,
+    entry: PolycomConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    runtime_data = entry.runtime_data
+    coordinator = runtime_data.coordinator
+    client = runtime_data.client
+    key = coordinator.capability_key
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "device_info": async_redact_data(runtime_data.device_info, TO_REDACT),
+        "capabilities": {
+            "key": key,
+            "unsupported_endpoints": sorted(
+                async_get_capability_registry(hass).unsupported(key)
+            ),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+            "in_call": coordinator.in_call,
+            "breaker": {
+                "state": coordinator.breaker.state,
+                "failures": coordinator.breaker.failures,
+            },
+        },
+        "connection": asdict(runtime_data.connection_stats),
+        "requests": {
+            "latency_p95": client.metrics.latency_percentile(95),
+            "failed_endpoints": client.metrics.failed_endpoints,
+            "endpoints": client.metrics.as_dict(),
+        },
+        "call_history": coordinator.call_history.as_dict(),
+        "data": async_redact_data(coordinator.data, TO_REDACT),
+    }
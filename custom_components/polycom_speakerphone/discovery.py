@@ -0,0 +1,170 @@
+"""Subnet discovery of Polycom phones for polycom_speakerphone."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import aiohttp
+from aiohttp import hdrs
+
+from .api import (
+    PolycomApiClient,
+    PolycomApiClientAuthenticationError,
+    PolycomApiClientError,
+    device_mac_address,
+)
+from .const import DEFAULT_USERNAME, LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+    from ipaddress import IPv4Network
+
+# Largest range scanned in one go, a /22
+MAX_DISCOVERY_HOSTS = 1024
+DISCOVERY_CONCURRENCY = 64
+# Phones answer on the LAN within milliseconds; addresses nobody answers on
+# are given up on quickly so a /24 takes seconds.
+DISCOVERY_TIMEOUT = aiohttp.ClientTimeout(total=3, sock_connect=1)
+
+HTTPS_PORT = 443
+DEVICE_INFO_PATH = "/api/v2/mgmt/device/info"
+# Found, lowercased, in a Polycom phone's login realm or Server header
+POLYCOM_SIGNATURES = ("polycom", "plcm")
+
+
+@dataclass(frozen=True, slots=True)
+class DiscoveredPhone:
+    """A phone found by a subnet scan."""
+
+    host: str
+    mac_address: str
+    vendor: str
+    model: str
+
+    @property
+    def title(self) -> str:
+        """Return the config entry title, as for a phone added by hand."""
+        return f"{self.vendor} {self.model}"
+
+
+@dataclass(slots=True)
+class DiscoveryResult:
+    """Outcome of a subnet scan."""
+
+    phones: list[DiscoveredPhone] = field(default_factory=list)
+    # Phones that rejected the password
+    rejected: list[str] = field(default_factory=list)
+
+
+def is_trio(device_info: dict) -> bool:
+    """Return whether a device/info payload is a Polycom Trio's."""
+    return "Trio" in str(device_info.get("ModelNumber", "")) and bool(
+        device_info.get("MACAddress")
+    )
+
+
+async def async_discover_phones(  # noqa: PLR0913
+    session: aiohttp.ClientSession,
+    network: IPv4Network,
+    password: str,
+    *,
+    port: int = HTTPS_PORT,
+    verify_ssl: bool = False,
+    exclude: Collection[str] = (),
+) -> DiscoveryResult:
+    """
+    Scan every address of a network for Trio phones.
+
+    Addresses are probed a bounded number at a time, each first without
+    credentials and with short timeouts; only addresses whose device/info
+    endpoint asks for a login are sent the password and fingerprinted.
+    Phones whose MAC address is in ``exclude`` are left out.
+    """
+    result = DiscoveryResult()
+    limit = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+
+    async def _async_scan(address: str) -> None:
+        host = address if port == HTTPS_PORT else f"{address}:{port}"
+        async with limit:
+            if not await _async_asks_for_login(session, host, verify_ssl):
+                return
+            client = PolycomApiClient(
+                host=host,
+                username=DEFAULT_USERNAME,
+                password=password,
+                session=session,
+                verify_ssl=verify_ssl,
+            )
+            try:
+                device_info = await client.async_get_device_info()
+            except PolycomApiClientAuthenticationError:
+                result.rejected.append(host)
+                return
+            except PolycomApiClientError as exception:
+                LOGGER.debug("Could not fingerprint %s: %s", host, exception)
+                return
+        if not is_trio(device_info):
+            return
+        mac_address = device_mac_address(device_info)
+        if mac_address in exclude:
+            return
+        result.phones.append(
+            DiscoveredPhone(
+                host=host,
+                mac_address=mac_address,
+                vendor=device_info.get("DeviceVendor", "Polycom"),
+                model=device_info.get("ModelNumber", "Unknown"),
+            )
+        )
+
+    await asyncio.gather(*(_async_scan(str(address)) for address in network.hosts()))
+    result.phones.sort(key=lambda phone: _sort_key(phone.host))
+    return result
+
+
+async def _async_asks_for_login(
+    session: aiohttp.ClientSession,
+    host: str,
+    verify_ssl: bool,  # noqa: FBT001
+) -> bool:
+    """
+    Return whether the address serves the Trio REST API.
+
+    Any web server may answer the request, so the password is only sent to
+    one whose login prompt or Server header names Polycom, or which
+    already answers with a Trio's device info.
+    """
+    try:
+        async with session.get(
+            f"https://{host}{DEVICE_INFO_PATH}",
+            timeout=DISCOVERY_TIMEOUT,
+            ssl=verify_ssl,
+            allow_redirects=False,
+        ) as response:
+            if response.status == HTTPStatus.OK:
+                payload = await response.json(content_type=None)
+                return isinstance(payload, dict) and is_trio(payload.get("data") or {})
+            return response.status == HTTPStatus.UNAUTHORIZED and _names_polycom(
+                response.headers.get(hdrs.WWW_AUTHENTICATE, ""),
+                response.headers.get(hdrs.SERVER, ""),
+            )
+    except (aiohttp.ClientError, TimeoutError, ValueError):
+        return False
+
+
+def _names_polycom(*headers: str) -> bool:
+    """Return whether any of the headers carries a Polycom signature."""
+    return any(
+        signature in header.lower()
+        for header in headers
+        for signature in POLYCOM_SIGNATURES
+    )
+
+
+def _sort_key(host: str) -> tuple[int, ...]:
+    """Order hosts numerically by address."""
+    address, _, port = host.partition(":")
+    return (*(int(part) for part in address.split(".")), int(port or HTTPS_PORT))
@@ -2,21 +2,38 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import ATTRIBUTION, DOMAIN
 from .coordinator import PolycomDataUpdateCoordinator
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .snapshot import PolycomSnapshot
+
 
 class PolycomEntity(CoordinatorEntity[PolycomDataUpdateCoordinator]):
     """PolycomEntity class."""
 
     _attr_attribution = ATTRIBUTION
+    # Snapshot fields the entity's state is built from; None means all of them
+    _depends_on: frozenset[str] | None = None
+    _value_fn: Callable[[PolycomSnapshot], Any]
 
-    def __init__(self, coordinator: PolycomDataUpdateCoordinator) -> None:
-        """Initialize."""
+    def __init__(
+        self, coordinator: PolycomDataUpdateCoordinator, field: str | None = None
+    ) -> None:
+        """Initialize, reading the state from the snapshot's ``field`` if given."""
         super().__init__(coordinator)
+        if field is not None:
+            self._value_fn = attrgetter(field)
+            self._depends_on = frozenset({field})
         
         # Get device information from runtime data
         runtime_data = coordinator.config_entry.runtime_data
@@ -50,3 +67,15 @@ class PolycomEntity(CoordinatorEntity[PolycomDataUpdateCoordinator]):
             sw_version=firmware_version,
             configuration_url=f"https://{host}",
         )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if a field this entity depends on changed."""
+        changed = self.coordinator.changed_fields
+        if (
+            changed is not None
+            and self._depends_on is not None
+            and changed.isdisjoint(self._depends_on)
+        ):
+            return
+        super()._handle_coordinator_update()
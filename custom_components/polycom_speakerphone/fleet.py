@@ -0,0 +1,102 @@
+"""Fleet-wide polling limits for polycom_speakerphone."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import random
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, FLEET_MAX_CONCURRENT_REFRESHES, POLL_JITTER
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from homeassistant.core import HomeAssistant
+
+DATA_FLEET: HassKey[PolycomFleetScheduler] = HassKey(f"{DOMAIN}_fleet")
+
+# Lower values are served first
+PRIORITY_IN_CALL = 0
+PRIORITY_IDLE = 1
+
+
+class PolycomFleetScheduler:
+    """
+    Scheduler shared by every config entry's coordinator.
+
+    It caps how many devices refresh at once across the whole fleet, hands
+    free slots to waiting devices in priority order (devices in a call
+    first), and spreads each device's polling phase across the interval so
+    that devices set up together do not keep firing together.
+    """
+
+    def __init__(self, max_concurrent_refreshes: int) -> None:
+        """Initialize."""
+        self._free = max_concurrent_refreshes
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def waiting(self) -> int:
+        """Return how many refreshes are queued for a slot."""
+        return sum(not future.done() for _, _, future in self._waiters)
+
+    @asynccontextmanager
+    async def slot(self, priority: int) -> AsyncIterator[None]:
+        """Hold one of the fleet's refresh slots."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int) -> None:
+        """Wait for a free slot."""
+        # Slots are handed straight to waiters, so a free slot means none wait
+        if self._free > 0:
+            self._free -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before the cancellation;
+            # pass it on instead of leaking it. Cancelled waiters left in the
+            # heap are skipped by _release.
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Hand the slot to the next waiter, or return it to the pool."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._free += 1
+
+    @staticmethod
+    def first_delay(interval: float) -> float:
+        """Return a random phase for a device's first scheduled poll."""
+        return random.uniform(0, interval)  # noqa: S311
+
+    @staticmethod
+    def jittered(interval: float) -> float:
+        """Return ``interval`` with a little jitter so phases keep drifting apart."""
+        return interval * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)  # noqa: S311
+
+
+def async_get_fleet_scheduler(hass: HomeAssistant) -> PolycomFleetScheduler:
+    """Return the scheduler shared by every config entry."""
+    if (scheduler := hass.data.get(DATA_FLEET)) is None:
+        scheduler = hass.data[DATA_FLEET] = PolycomFleetScheduler(
+            FLEET_MAX_CONCURRENT_REFRESHES
+        )
+    return scheduler
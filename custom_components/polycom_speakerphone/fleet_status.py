@@ -0,0 +1,125 @@
+"""Fleet-wide status counters for polycom_speakerphone."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+from .history import IDLE_STATE, RINGING_STATE
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+    from .snapshot import PolycomSnapshot
+
+DATA_FLEET_STATUS: HassKey[PolycomFleetStatus] = HassKey(f"{DOMAIN}_fleet_status")
+
+FLEET_COUNTERS = ("devices", "offline", "unregistered", "in_call", "do_not_disturb")
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceStatus:
+    """What one phone contributes to the fleet counters."""
+
+    offline: bool
+    # Of the first line, as shown by the phone's Line Registered sensor
+    unregistered: bool
+    in_call: bool
+    do_not_disturb: bool
+
+    @classmethod
+    def from_snapshot(cls, snapshot: PolycomSnapshot, *, online: bool) -> DeviceStatus:
+        """Return the status shown by a phone's snapshot."""
+        return cls(
+            offline=not online,
+            unregistered=snapshot.line_registered is False,
+            in_call=snapshot.phone_state not in (None, IDLE_STATE, RINGING_STATE),
+            do_not_disturb=snapshot.do_not_disturb is True,
+        )
+
+    def counts(self) -> dict[str, int]:
+        """Return the phone's contribution to each counter."""
+        return {
+            "devices": 1,
+            "offline": int(self.offline),
+            "unregistered": int(self.unregistered),
+            "in_call": int(self.in_call),
+            "do_not_disturb": int(self.do_not_disturb),
+        }
+
+
+class PolycomFleetStatus:
+    """
+    Counters across every phone, kept up to date incrementally.
+
+    Each coordinator reports its phone's status whenever it notifies its
+    entities; only the difference to the phone's previous status is applied,
+    so an update costs the same however many phones there are. Listeners are
+    told which counters changed.
+
+    The fleet sensors are provided by one of the loaded entries, the host.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.counters = dict.fromkeys(FLEET_COUNTERS, 0)
+        self._devices: dict[str, DeviceStatus] = {}
+        self._listeners: list[Callable[[frozenset[str]], None]] = []
+        self.host_entry_id: str | None = None
+
+    @callback
+    def async_update(self, entry_id: str, status: DeviceStatus | None) -> None:
+        """Apply a phone's new status; None removes the phone."""
+        previous = self._devices.get(entry_id)
+        if status == previous:
+            return
+        if status is None:
+            del self._devices[entry_id]
+        else:
+            self._devices[entry_id] = status
+
+        old = previous.counts() if previous is not None else {}
+        new = status.counts() if status is not None else {}
+        changed = set()
+        for counter in FLEET_COUNTERS:
+            if delta := new.get(counter, 0) - old.get(counter, 0):
+                self.counters[counter] += delta
+                changed.add(counter)
+        if changed:
+            for listener in list(self._listeners):
+                listener(frozenset(changed))
+
+    @callback
+    def async_add_listener(
+        self, listener: Callable[[frozenset[str]], None]
+    ) -> Callable[[], None]:
+        """Call ``listener`` with the changed counters; return a remover."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def claim_host(self, entry_id: str) -> bool:
+        """Make the entry the host of the fleet sensors, unless there is one."""
+        if self.host_entry_id not in (None, entry_id):
+            return False
+        self.host_entry_id = entry_id
+        return True
+
+    def release_host(self, entry_id: str) -> bool:
+        """Give up hosting; return whether the entry was the host."""
+        if self.host_entry_id != entry_id:
+            return False
+        self.host_entry_id = None
+        return True
+
+
+def async_get_fleet_status(hass: HomeAssistant) -> PolycomFleetStatus:
+    """Return the fleet status shared by every config entry."""
+    if (status := hass.data.get(DATA_FLEET_STATUS)) is None:
+        status = hass.data[DATA_FLEET_STATUS] = PolycomFleetStatus()
+    return status
@@ -0,0 +1,158 @@
+"""Call history for polycom_speakerphone."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from datetime import date, datetime
+
+# pollForStatus state of a phone that rings but has not been answered
+RINGING_STATE = "Ringing"
+IDLE_STATE = "Idle"
+
+
+@dataclass(frozen=True, slots=True)
+class CallRecord:
+    """One finished call, or a ring nobody answered."""
+
+    started: datetime
+    ended: datetime
+    answered: bool
+    # Talk time in seconds, 0 for an unanswered ring
+    duration: float
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record in a JSON-serializable form."""
+        return {
+            "started": self.started.isoformat(),
+            "ended": self.ended.isoformat(),
+            "answered": self.answered,
+            "duration": self.duration,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CallRecord | None:
+        """Rebuild a record stored with ``as_dict``."""
+        started = dt_util.parse_datetime(data.get("started", ""))
+        ended = dt_util.parse_datetime(data.get("ended", ""))
+        if started is None or ended is None:
+            return None
+        return cls(
+            started=started,
+            ended=ended,
+            answered=bool(data.get("answered")),
+            duration=float(data.get("duration", 0)),
+        )
+
+
+class PolycomCallHistory:
+    """
+    Calls seen on one phone, tracked from its state transitions.
+
+    The last ``size`` calls are kept in a ring buffer. The day's counters and
+    the running totals behind the average duration are updated as each call
+    ends, so reading them never scans the history.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize."""
+        self.calls: deque[CallRecord] = deque(maxlen=size)
+        self._ring_started: datetime | None = None
+        self._talk_started: datetime | None = None
+        # Totals over the calls in the buffer, kept in step as records rotate
+        self._answered = 0
+        self._talk_time = 0.0
+        self._day: date | None = None
+        self.calls_today = 0
+        self.missed_today = 0
+        self.talk_time_today = 0.0
+
+    @property
+    def average_duration(self) -> float | None:
+        """Return the average talk time of the answered calls in the buffer."""
+        if not self._answered:
+            return None
+        return self._talk_time / self._answered
+
+    def observe(self, state: str | None, now: datetime) -> CallRecord | None:
+        """Feed the phone's current state; return the call it ended, if any."""
+        self._roll_day(now)
+        if not state:
+            return None
+        if state == IDLE_STATE:
+            return self._finish(now)
+        if state == RINGING_STATE:
+            if self._ring_started is None and self._talk_started is None:
+                self._ring_started = now
+        elif self._talk_started is None:
+            # Answered, or an outgoing call
+            self._talk_started = now
+        return None
+
+    def _finish(self, now: datetime) -> CallRecord | None:
+        """Record the call that just ended."""
+        if self._talk_started is not None:
+            record = CallRecord(
+                started=self._ring_started or self._talk_started,
+                ended=now,
+                answered=True,
+                duration=(now - self._talk_started).total_seconds(),
+            )
+        elif self._ring_started is not None:
+            record = CallRecord(
+                started=self._ring_started, ended=now, answered=False, duration=0.0
+            )
+        else:
+            return None
+        self._ring_started = self._talk_started = None
+        self._add(record)
+        if record.answered:
+            self.calls_today += 1
+            self.talk_time_today += record.duration
+        else:
+            self.missed_today += 1
+        return record
+
+    def _add(self, record: CallRecord) -> None:
+        """Append a record, keeping the buffer totals in step."""
+        if len(self.calls) == self.calls.maxlen and (evicted := self.calls[0]).answered:
+            self._answered -= 1
+            self._talk_time -= evicted.duration
+        self.calls.append(record)
+        if record.answered:
+            self._answered += 1
+            self._talk_time += record.duration
+
+    def _roll_day(self, now: datetime) -> None:
+        """Reset the day's counters at local midnight."""
+        today = dt_util.as_local(now).date()
+        if today != self._day:
+            self._day = today
+            self.calls_today = self.missed_today = 0
+            self.talk_time_today = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the history in a JSON-serializable form."""
+        return {
+            "calls": [record.as_dict() for record in self.calls],
+            "day": self._day.isoformat() if self._day else None,
+            "calls_today": self.calls_today,
+            "missed_today": self.missed_today,
+            "talk_time_today": self.talk_time_today,
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore a history stored with ``as_dict``."""
+        for stored in data.get("calls", []):
+            if (record := CallRecord.from_dict(stored)) is not None:
+                self._add(record)
+        if (day := dt_util.parse_date(data.get("day") or "")) is not None:
+            self._day = day
+            self.calls_today = data.get("calls_today", 0)
+            self.missed_today = data.get("missed_today", 0)
+            self.talk_time_today = data.get("talk_time_today", 0.0)
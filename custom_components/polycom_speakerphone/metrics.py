@@ -0,0 +1,159 @@
+"""Request instrumentation for the Polycom API client."""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds of the latency histogram buckets, in seconds; the last bucket
+# catches everything slower.
+LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Recent latency percentiles cover the current and the previous window, so
+# they follow a phone that just got slow instead of its whole uptime.
+LATENCY_WINDOW = 300
+
+
+def _empty_histogram() -> list[int]:
+    """Return zeroed latency histogram counts."""
+    return [0] * (len(LATENCY_BUCKETS) + 1)
+
+
+def _bucket_percentile(counts: list[int], percent: float) -> float | None:
+    """Return the upper bound of the bucket holding the given percentile."""
+    total = sum(counts)
+    if not total:
+        return None
+    rank = total * percent / 100
+    seen = 0
+    for bound, count in zip(LATENCY_BUCKETS, counts, strict=False):
+        seen += count
+        if seen >= rank:
+            return bound
+    # Overflow bucket: anything slower than the last bound
+    return LATENCY_BUCKETS[-1]
+
+
+@dataclass(slots=True)
+class EndpointMetrics:
+    """Counters for one endpoint of one device."""
+
+    requests: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    unsupported: int = 0
+    bytes_received: int = 0
+    # Answers whose body matched the previous one and were not decoded again
+    unchanged: int = 0
+    latency_counts: list[int] = field(default_factory=_empty_histogram)
+    window_counts: list[int] = field(default_factory=_empty_histogram)
+    previous_window_counts: list[int] = field(default_factory=_empty_histogram)
+    window_started: float = field(default_factory=time.monotonic)
+    # Error of the most recent request, None if it succeeded
+    last_error: str | None = None
+
+    def record(
+        self,
+        latency: float,
+        *,
+        size: int = 0,
+        error: str | None = None,
+        unchanged: bool = False,
+    ) -> None:
+        """Record one finished request."""
+        self.requests += 1
+        self.unchanged += unchanged
+        bucket = bisect_left(LATENCY_BUCKETS, latency)
+        self.latency_counts[bucket] += 1
+        self._roll_window(time.monotonic())
+        self.window_counts[bucket] += 1
+        self.bytes_received += size
+        self.last_error = error
+        if error == "timeout":
+            self.timeouts += 1
+        elif error == "unsupported":
+            self.unsupported += 1
+        elif error is not None:
+            self.errors += 1
+
+    def _roll_window(self, now: float) -> None:
+        """Start a new latency window once the current one has run out."""
+        elapsed = now - self.window_started
+        if elapsed < LATENCY_WINDOW:
+            return
+        if elapsed < 2 * LATENCY_WINDOW:
+            self.previous_window_counts = self.window_counts
+        else:
+            # Nothing was recorded during the previous window
+            self.previous_window_counts = _empty_histogram()
+        self.window_counts = _empty_histogram()
+        self.window_started = now - elapsed % LATENCY_WINDOW
+
+    def recent_latency_counts(self) -> list[int]:
+        """Return the histogram of the last one to two latency windows."""
+        self._roll_window(time.monotonic())
+        return [
+            current + previous
+            for current, previous in zip(
+                self.window_counts, self.previous_window_counts, strict=True
+            )
+        ]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for diagnostics."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "unsupported": self.unsupported,
+            "bytes_received": self.bytes_received,
+            "unchanged": self.unchanged,
+            "latency_p50": _bucket_percentile(self.latency_counts, 50),
+            "latency_p95": _bucket_percentile(self.latency_counts, 95),
+            "recent_latency_p95": _bucket_percentile(self.recent_latency_counts(), 95),
+            "latency_histogram": dict(
+                zip(
+                    [*(f"<={bound}s" for bound in LATENCY_BUCKETS), "slower"],
+                    self.latency_counts,
+                    strict=True,
+                )
+            ),
+            "last_error": self.last_error,
+        }
+
+
+class PolycomClientMetrics:
+    """Per-endpoint request metrics for one device."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.endpoints: dict[str, EndpointMetrics] = {}
+
+    def endpoint(self, name: str) -> EndpointMetrics:
+        """Return the metrics of an endpoint."""
+        if (metrics := self.endpoints.get(name)) is None:
+            metrics = self.endpoints[name] = EndpointMetrics()
+        return metrics
+
+    def latency_percentile(self, percent: float) -> float | None:
+        """Return a recent latency percentile across all endpoints, in seconds."""
+        counts = _empty_histogram()
+        for metrics in self.endpoints.values():
+            for index, count in enumerate(metrics.recent_latency_counts()):
+                counts[index] += count
+        return _bucket_percentile(counts, percent)
+
+    @property
+    def failed_endpoints(self) -> list[str]:
+        """Return the endpoints whose most recent request failed."""
+        return sorted(
+            name
+            for name, metrics in self.endpoints.items()
+            if metrics.last_error not in (None, "unsupported")
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all metrics for diagnostics."""
+        return {name: metrics.as_dict() for name, metrics in self.endpoints.items()}
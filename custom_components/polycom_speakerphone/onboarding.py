@@ -0,0 +1,202 @@
+"""Validation of phones being added to polycom_speakerphone."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import dt as dt_util
+
+from .api import (
+    ENDPOINTS,
+    REQUIRED_ENDPOINTS,
+    PolycomApiClient,
+    PolycomApiClientAuthenticationError,
+    PolycomApiClientCommunicationError,
+    PolycomApiClientError,
+    PolycomApiClientNotSupportedError,
+    device_mac_address,
+)
+from .capabilities import VOLATILE_ENDPOINTS, capability_key
+from .const import DEFAULT_USERNAME, LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import aiohttp
+
+# Phones validated at the same time during a bulk import
+BULK_VALIDATION_CONCURRENCY = 8
+
+
+@dataclass(frozen=True, slots=True)
+class ValidatedPhone:
+    """A phone that answered with the given credentials."""
+
+    host: str
+    password: str
+    mac_address: str
+    title: str
+    device_info: dict[str, Any]
+    # Stored with the entry so setup can skip endpoints known to be missing
+    capabilities: dict[str, Any] | None = None
+
+
+@dataclass(slots=True)
+class BulkValidation:
+    """Outcome of validating a list of phones."""
+
+    phones: list[ValidatedPhone] = field(default_factory=list)
+    # Host -> "auth", "connection" or "unknown"
+    failed: dict[str, str] = field(default_factory=dict)
+
+
+def parse_phone_list(text: str, default_password: str | None) -> list[tuple[str, str]]:
+    """
+    Parse one phone per line as "host password" or "host,password".
+
+    Lines holding only a host use ``default_password``; blank lines and lines
+    starting with # are skipped. Raises ValueError naming the first bad line.
+    """
+    phones = []
+    for line in text.splitlines():
+        line = line.strip()  # noqa: PLW2901
+        if not line or line.startswith("#"):
+            continue
+        # Only the first separator splits; the password may contain either
+        host, *rest = re.split(r"[,\s]", line, maxsplit=1)
+        password = (rest[0].strip() if rest else "") or default_password
+        if not password:
+            raise ValueError(line)
+        phones.append((host, password))
+    return phones
+
+
+async def async_validate_phone(
+    session: aiohttp.ClientSession,
+    host: str,
+    password: str,
+    *,
+    verify_ssl: bool,
+) -> ValidatedPhone:
+    """Fetch a phone's device and network info; raise the API's errors."""
+    client = PolycomApiClient(
+        host=host,
+        username=DEFAULT_USERNAME,
+        password=password,
+        session=session,
+        verify_ssl=verify_ssl,
+    )
+    data = await client.async_get_endpoints(REQUIRED_ENDPOINTS)
+    device_info = data["device_info"]
+    return ValidatedPhone(
+        host=host,
+        password=password,
+        mac_address=device_mac_address(device_info),
+        title=(
+            f"{device_info.get('DeviceVendor', 'Polycom')} "
+            f"{device_info.get('ModelNumber', 'Unknown')}"
+        ),
+        device_info=device_info,
+    )
+
+
+async def async_fingerprint_capabilities(
+    session: aiohttp.ClientSession,
+    phone: ValidatedPhone,
+    *,
+    verify_ssl: bool,
+) -> dict[str, Any] | None:
+    """Probe the optional endpoints once and record which are missing."""
+    if (key := capability_key(phone.device_info)) is None:
+        return None
+    client = PolycomApiClient(
+        host=phone.host,
+        username=DEFAULT_USERNAME,
+        password=phone.password,
+        session=session,
+        verify_ssl=verify_ssl,
+    )
+    errors: dict[str, PolycomApiClientError] = {}
+    await client.async_get_endpoints(
+        (endpoint for endpoint in ENDPOINTS if endpoint not in REQUIRED_ENDPOINTS),
+        errors,
+    )
+    return {
+        "key": key,
+        "unsupported": sorted(
+            endpoint
+            for endpoint, error in errors.items()
+            if isinstance(error, PolycomApiClientNotSupportedError)
+            and endpoint not in VOLATILE_ENDPOINTS
+        ),
+        "probed_at": dt_util.utcnow().isoformat(),
+    }
+
+
+async def async_validate_phones(
+    session: aiohttp.ClientSession,
+    credentials: Sequence[tuple[str, str]],
+    *,
+    verify_ssl: bool,
+) -> BulkValidation:
+    """
+    Validate many phones at once over one session.
+
+    At most BULK_VALIDATION_CONCURRENCY phones are validated at the same
+    time. The optional endpoints are then probed on one phone per
+    model/firmware combination and the resulting fingerprint is shared by
+    every phone with that combination.
+    """
+    result = BulkValidation()
+    limit = asyncio.Semaphore(BULK_VALIDATION_CONCURRENCY)
+
+    async def _async_validate(host: str, password: str) -> ValidatedPhone | None:
+        async with limit:
+            try:
+                return await async_validate_phone(
+                    session, host, password, verify_ssl=verify_ssl
+                )
+            except PolycomApiClientAuthenticationError:
+                result.failed[host] = "auth"
+            except PolycomApiClientCommunicationError:
+                result.failed[host] = "connection"
+            except PolycomApiClientError as exception:
+                LOGGER.debug("Could not validate %s: %s", host, exception)
+                result.failed[host] = "unknown"
+            return None
+
+    validated = await asyncio.gather(
+        *(_async_validate(host, password) for host, password in credentials)
+    )
+
+    by_key: dict[str | None, list[ValidatedPhone]] = {}
+    for phone in validated:
+        if phone is not None:
+            by_key.setdefault(capability_key(phone.device_info), []).append(phone)
+
+    async def _async_fingerprint(phone: ValidatedPhone) -> dict[str, Any] | None:
+        async with limit:
+            try:
+                return await async_fingerprint_capabilities(
+                    session, phone, verify_ssl=verify_ssl
+                )
+            except PolycomApiClientError as exception:
+                # Setup probes the endpoints itself instead
+                LOGGER.debug("Could not fingerprint %s: %s", phone.host, exception)
+                return None
+
+    keys = [key for key in by_key if key is not None]
+    fingerprints = await asyncio.gather(
+        *(_async_fingerprint(by_key[key][0]) for key in keys)
+    )
+    capabilities = dict(zip(keys, fingerprints, strict=True))
+    for key, phones in by_key.items():
+        result.phones.extend(
+            dataclasses.replace(phone, capabilities=capabilities.get(key))
+            for phone in phones
+        )
+    return result
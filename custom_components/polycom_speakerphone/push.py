@@ -0,0 +1,149 @@
+"""Push notifications from Polycom phones for polycom_speakerphone."""
+
+from __future__ import annotations
+
+import json
+import xml.etree.ElementTree as ET
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import web
+from homeassistant.components import webhook
+
+from .api import normalize_mac
+from .const import CONF_WEBHOOK_ID, DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+    from .data import PolycomConfigEntry
+
+# Notifications are a few hundred bytes; refuse anything much larger
+MAX_NOTIFICATION_SIZE = 16384
+
+# Telephony event notifications (apps.telNotification.*) that imply a state
+# without looking at their payload
+EVENT_STATES = {
+    "IncomingCallEvent": "Ringing",
+    "OutgoingCallEvent": "Active",
+    "OnHookEvent": "Idle",
+}
+
+# CallInfo/CallState values reported by CallStateChangeEvent
+RINGING_CALL_STATES = frozenset({"Offering", "Ringing", "RingBack"})
+ENDED_CALL_STATES = frozenset({"Disconnected", "Free"})
+
+
+def _call_state_change(event: ET.Element) -> str:
+    """Return the phone state described by a CallStateChangeEvent."""
+    states = [
+        call_state.text.strip()
+        for call_state in event.iter("CallState")
+        if call_state.text and call_state.text.strip()
+    ]
+    live_states = [state for state in states if state not in ENDED_CALL_STATES]
+    if not live_states:
+        return "Idle"
+    if any(state in RINGING_CALL_STATES for state in live_states):
+        return "Ringing"
+    return "Active"
+
+
+def _parse_xml(body: str) -> dict[str, Any] | None:
+    """Parse a telephony event notification (PolycomIPPhone XML)."""
+    # Expat refuses entity expansion attacks on its own, and the body size is
+    # capped by the caller.
+    root = ET.fromstring(body)  # noqa: S314
+    for event in root:
+        if event.tag in EVENT_STATES:
+            state = EVENT_STATES[event.tag]
+        elif event.tag == "CallStateChangeEvent":
+            state = _call_state_change(event)
+        else:
+            continue
+        update: dict[str, Any] = {"State": state}
+        if (mac_address := event.findtext("MACAddress")) is not None:
+            update["MACAddress"] = mac_address.strip()
+        return update
+    return None
+
+
+def _parse_json(body: str) -> dict[str, Any] | None:
+    """Parse a pollForStatus-shaped JSON notification."""
+    payload = json.loads(body)
+    if not isinstance(payload, dict):
+        return None
+    payload = payload.get("data", payload)
+    if not isinstance(payload, dict) or "State" not in payload:
+        return None
+    return payload
+
+
+def parse_notification(body: str) -> dict[str, Any] | None:
+    """
+    Turn a pushed notification into a partial pollForStatus payload.
+
+    Phones send XML telephony event notifications; a JSON body shaped like
+    the pollForStatus data is accepted as well. Returns None for payloads
+    that carry no phone state.
+    """
+    body = body.strip()
+    try:
+        if body.startswith("<"):
+            return _parse_xml(body)
+        return _parse_json(body)
+    except (ET.ParseError, ValueError):
+        return None
+
+
+def async_register_push(
+    hass: HomeAssistant,
+    entry: PolycomConfigEntry,
+) -> Callable[[], None]:
+    """Register the webhook the phone pushes notifications to."""
+    webhook_id = entry.data[CONF_WEBHOOK_ID]
+
+    async def handle_webhook(
+        hass: HomeAssistant,  # noqa: ARG001
+        webhook_id: str,  # noqa: ARG001
+        request: web.Request,
+    ) -> web.Response:
+        """Apply a pushed notification to the coordinator's data."""
+        if request.content_length and request.content_length > MAX_NOTIFICATION_SIZE:
+            return web.Response(status=413)
+        body = await request.text()
+        if len(body) > MAX_NOTIFICATION_SIZE:
+            return web.Response(status=413)
+
+        if (update := parse_notification(body)) is None:
+            LOGGER.debug("Ignoring notification from %s", entry.runtime_data.host)
+            return web.Response(status=204)
+
+        # Compared as normalised on both sides, see device_mac_address
+        mac_address = normalize_mac(update.pop("MACAddress", ""))
+        if mac_address and mac_address != entry.runtime_data.mac_address:
+            LOGGER.warning(
+                "Ignoring notification for %s pushed to %s",
+                mac_address,
+                entry.runtime_data.host,
+            )
+            return web.Response(status=204)
+
+        entry.runtime_data.coordinator.async_apply_push(update)
+        return web.Response(status=204)
+
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        entry.title,
+        webhook_id,
+        handle_webhook,
+        local_only=True,
+        allowed_methods=["POST"],
+    )
+
+    def unregister() -> None:
+        webhook.async_unregister(hass, webhook_id)
+
+    return unregister
@@ -0,0 +1,229 @@
+"""In-call media quality sampling for polycom_speakerphone."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .api import (
+    PolycomApiClientAuthenticationError,
+    PolycomApiClientCommunicationError,
+    PolycomApiClientError,
+    PolycomApiClientNotSupportedError,
+)
+from .const import CALL_QUALITY_SAMPLE_INTERVAL
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from .api import PolycomApiClient
+
+# Sampled metrics: jitter and latency in milliseconds, packet loss in percent
+QUALITY_METRICS = ("jitter", "latency", "packet_loss")
+
+
+def _number(value: Any) -> float | None:
+    """Return a sessionStats counter as a float."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _audio_stream(session_stats: Any) -> dict[str, Any] | None:
+    """Return the audio stream of the first media session."""
+    session = session_stats
+    if isinstance(session, list):
+        session = session[0] if session else None
+    if not isinstance(session, dict):
+        return None
+    streams = session.get("Streams")
+    if not isinstance(streams, list) or not streams:
+        # Flat payload: the session is the stream
+        return session
+    for stream in streams:
+        if isinstance(stream, dict) and stream.get("Category") == "Audio":
+            return stream
+    return streams[0] if isinstance(streams[0], dict) else None
+
+
+def decode_session_stats(
+    session_stats: Any,
+) -> tuple[dict[str, float | None], str | None]:
+    """Decode one sessionStats payload into quality metrics and the codec."""
+    stream = _audio_stream(session_stats)
+    if stream is None:
+        return dict.fromkeys(QUALITY_METRICS), None
+
+    packet_loss = _number(stream.get("PacketLoss"))
+    lost = _number(stream.get("PacketsLost"))
+    expected = _number(stream.get("PacketsExpected"))
+    if packet_loss is None and lost is not None and expected:
+        packet_loss = lost / expected * 100
+    codec = stream.get("RxCodec") or stream.get("TxCodec") or stream.get("Codec")
+    return {
+        "jitter": _number(stream.get("Jitter")),
+        "latency": _number(stream.get("Latency")),
+        "packet_loss": packet_loss,
+    }, codec
+
+
+class _SampleBuffer:
+    """Fixed-size ring of float samples, keeping the most recent ones."""
+
+    __slots__ = ("_count", "_values")
+
+    def __init__(self, capacity: int) -> None:
+        """Allocate the buffer once."""
+        self._values = array("d", bytes(8 * capacity))
+        self._count = 0
+
+    def append(self, value: float) -> None:
+        """Add a sample, overwriting the oldest once full."""
+        self._values[self._count % len(self._values)] = value
+        self._count += 1
+
+    def aggregate(self) -> dict[str, float] | None:
+        """Return min, max, mean and p95 of the samples."""
+        size = min(self._count, len(self._values))
+        if not size:
+            return None
+        ordered = sorted(self._values[:size])
+        return {
+            "min": ordered[0],
+            "max": ordered[-1],
+            "mean": math.fsum(ordered) / size,
+            "p95": ordered[math.ceil(size * 0.95) - 1],
+        }
+
+    def clear(self) -> None:
+        """Forget the samples, keeping the allocation."""
+        self._count = 0
+
+
+@dataclass(frozen=True, slots=True)
+class CallQuality:
+    """Media quality of one finished call."""
+
+    ended: datetime
+    codec: str | None
+    samples: int
+    # Metric -> {"min", "max", "mean", "p95"}, None when never reported
+    metrics: dict[str, dict[str, float] | None]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the aggregates in a JSON-serializable form."""
+        return {
+            "ended": self.ended.isoformat(),
+            "codec": self.codec,
+            "samples": self.samples,
+            **self.metrics,
+        }
+
+
+class PolycomCallQualitySampler:
+    """
+    Sample sessionStats at a high rate while a call is active.
+
+    Samples go into preallocated ring buffers, one per metric, and are
+    aggregated in a single pass per metric when the call ends; nothing is
+    written per sample, so only the per-call aggregates reach the recorder.
+
+    Sampling stops while the phone does not answer (the coordinator pauses
+    it when a refresh fails) and resumes into the same call's buffers once it
+    does; a phone rejecting sessionStats is not asked again during the call.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize."""
+        self._buffers = {metric: _SampleBuffer(capacity) for metric in QUALITY_METRICS}
+        self._samples = 0
+        self._codec: str | None = None
+        # Whether a call is being followed, and whether its phone has no stats
+        self._active = False
+        self._unsupported = False
+        self._task: asyncio.Task[None] | None = None
+        self.last_call: CallQuality | None = None
+
+    @property
+    def sampling(self) -> bool:
+        """Return whether a call is being sampled right now."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def needs_sampler(self) -> bool:
+        """Return whether a sampling task should be started for the call."""
+        return not self.sampling and not self._unsupported
+
+    def add(self, session_stats: Any) -> None:
+        """Add the metrics of one sessionStats payload."""
+        values, codec = decode_session_stats(session_stats)
+        added = False
+        for metric, value in values.items():
+            if value is not None:
+                self._buffers[metric].append(value)
+                added = True
+        if added:
+            self._samples += 1
+        self._codec = codec or self._codec
+
+    def start(self, task: asyncio.Task[None]) -> None:
+        """Track the task sampling the call, which may have been paused."""
+        if not self._active:
+            for buffer in self._buffers.values():
+                buffer.clear()
+            self._samples = 0
+            self._codec = None
+            self._active = True
+        self._task = task
+
+    def pause(self) -> None:
+        """Stop sampling, keeping what was sampled of the call so far."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def async_sample(
+        self, client: PolycomApiClient, allowed: Callable[[], bool]
+    ) -> None:
+        """Sample sessionStats until cancelled or no longer ``allowed``."""
+        while allowed():
+            try:
+                self.add(await client.async_get_session_stats())
+            except (
+                PolycomApiClientAuthenticationError,
+                PolycomApiClientNotSupportedError,
+            ):
+                # A refused login is not retried for the rest of the call
+                self._unsupported = True
+                return
+            except PolycomApiClientCommunicationError:
+                # Resumed by the coordinator once the phone answers again
+                return
+            except PolycomApiClientError:
+                # A missed sample only thins the statistics
+                pass
+            await asyncio.sleep(CALL_QUALITY_SAMPLE_INTERVAL)
+
+    def finish(self, now: datetime) -> CallQuality | None:
+        """Stop sampling and aggregate the call that just ended."""
+        if not self._active:
+            return None
+        self.pause()
+        self._active = False
+        self._unsupported = False
+        if not self._samples:
+            return None
+        self.last_call = CallQuality(
+            ended=now,
+            codec=self._codec,
+            samples=self._samples,
+            metrics={
+                metric: buffer.aggregate() for metric, buffer in self._buffers.items()
+            },
+        )
+        return self.last_call
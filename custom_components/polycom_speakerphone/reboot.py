@@ -0,0 +1,123 @@
+"""Rolling fleet reboots for polycom_speakerphone."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .api import ENDPOINTS, PolycomApiClientError
+from .const import LOGGER, REBOOT_POLL_INTERVAL
+from .coordinator import uptime_seconds
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from .data import PolycomConfigEntry
+
+# Outcome of one phone's reboot
+RESULT_REBOOTED = "rebooted"
+RESULT_BUSY = "busy"
+RESULT_FAILED = "failed"
+RESULT_OFFLINE = "offline"
+RESULT_SKIPPED = "skipped"
+
+
+@dataclass(frozen=True, kw_only=True)
+class RollingRebootOptions:
+    """Limits of a rolling reboot."""
+
+    # Phones rebooting at the same time
+    concurrency: int
+    # Failed phones after which no further phones are started
+    max_failures: int
+    # Seconds to wait for a phone to become idle, then to come back online
+    idle_timeout: float
+    online_timeout: float
+
+
+class PolycomRollingReboot:
+    """
+    Reboot a set of phones a few at a time.
+
+    Each phone is first polled until it is idle, then rebooted with
+    safeReboot and followed until it is back online (its uptime restarted)
+    with its line registered again. Once ``max_failures`` phones failed, the
+    phones that have not started yet are skipped, so a bad night does not
+    take the whole fleet down.
+    """
+
+    def __init__(
+        self,
+        entries: Sequence[PolycomConfigEntry],
+        options: RollingRebootOptions,
+    ) -> None:
+        """Initialize."""
+        self._entries = entries
+        self._options = options
+        self._limit = asyncio.Semaphore(options.concurrency)
+        self._failures = 0
+        self.results: dict[str, str] = {}
+
+    async def async_run(self) -> dict[str, str]:
+        """Reboot every phone; return the outcome per phone name."""
+        await asyncio.gather(*(self._async_reboot(entry) for entry in self._entries))
+        return self.results
+
+    async def _async_reboot(self, entry: PolycomConfigEntry) -> None:
+        """Reboot one phone once a slot is free."""
+        async with self._limit:
+            if self._failures >= self._options.max_failures:
+                result = RESULT_SKIPPED
+            else:
+                try:
+                    result = await self._async_reboot_phone(entry)
+                except PolycomApiClientError as exception:
+                    LOGGER.warning("Could not reboot %s: %s", entry.title, exception)
+                    result = RESULT_FAILED
+                if result != RESULT_REBOOTED:
+                    self._failures += 1
+        LOGGER.info("Rolling reboot of %s: %s", entry.title, result)
+        self.results[entry.title] = result
+
+    async def _async_reboot_phone(self, entry: PolycomConfigEntry) -> str:
+        """Wait for the phone to be idle, reboot it and wait for it to return."""
+        coordinator = entry.runtime_data.coordinator
+        client = entry.runtime_data.client
+
+        deadline = time.monotonic() + self._options.idle_timeout
+        await coordinator.async_refresh_endpoints({"poll_status"})
+        while coordinator.in_call:
+            if time.monotonic() > deadline:
+                return RESULT_BUSY
+            await asyncio.sleep(REBOOT_POLL_INTERVAL)
+            await coordinator.async_refresh_endpoints({"poll_status"})
+
+        await client.async_reboot()
+        rebooted_at = time.monotonic()
+        deadline = rebooted_at + self._options.online_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(REBOOT_POLL_INTERVAL)
+            errors: dict[str, PolycomApiClientError] = {}
+            try:
+                await coordinator.async_refresh_endpoints(
+                    {"device_info", "line_info"}, errors
+                )
+            except PolycomApiClientError:
+                # Still down
+                continue
+            if "line_info" in errors:
+                # The line state shown is still the one from before the reboot
+                continue
+            uptime = uptime_seconds(coordinator.data["device_info"])
+            if (
+                uptime is not None
+                and uptime < time.monotonic() - rebooted_at
+                and coordinator.snapshot.line_registered
+            ):
+                # Catch up on everything that changed while it was down
+                coordinator.expire_endpoints(*ENDPOINTS)
+                await coordinator.async_request_refresh()
+                return RESULT_REBOOTED
+        return RESULT_OFFLINE
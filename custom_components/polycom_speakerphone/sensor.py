@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from homeassistant.components.sensor import (
@@ -11,101 +11,256 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import PERCENTAGE, UnitOfInformation
+from homeassistant.const import PERCENTAGE, UnitOfInformation, UnitOfTime
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 
+from .const import ATTRIBUTION, DOMAIN
 from .entity import PolycomEntity
-
-from homeassistant.util import dt as dt_util
+from .fleet_status import async_get_fleet_status
+from .statistics import LONG_TERM_STATISTICS
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .coordinator import PolycomDataUpdateCoordinator
     from .data import PolycomConfigEntry
+    from .fleet_status import PolycomFleetStatus
+
+
+@dataclass(frozen=True, kw_only=True)
+class PolycomSensorEntityDescription(SensorEntityDescription):
+    """Describes a Polycom sensor."""
+
+    # Snapshot field the state is read from
+    field: str
+
 
 ENTITY_DESCRIPTIONS = (
-    SensorEntityDescription(
+    PolycomSensorEntityDescription(
         key="phone_state",
         name="Phone State",
         icon="mdi:phone",
+        field="phone_state",
     ),
-    SensorEntityDescription(
+    PolycomSensorEntityDescription(
         key="last_call_time",
         name="Last Call Time",
         icon="mdi:clock-outline",
         device_class=SensorDeviceClass.TIMESTAMP,
+        field="last_call_time",
     ),
-    SensorEntityDescription(
+    PolycomSensorEntityDescription(
         key="call_duration",
         name="Call Duration",
         icon="mdi:timer-outline",
+        field="call_duration",
     ),
-    SensorEntityDescription(
+    PolycomSensorEntityDescription(
         key="phone_error",
         name="Phone Error",
         icon="mdi:alert-circle",
+        field="phone_error",
     ),
-    SensorEntityDescription(
+    PolycomSensorEntityDescription(
         key="cpu_usage",
         name="CPU Usage",
         icon="mdi:cpu-64-bit",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="cpu_usage",
     ),
-    SensorEntityDescription(
+    PolycomSensorEntityDescription(
         key="memory_usage",
         name="Memory Usage",
         icon="mdi:memory",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="memory_usage",
     ),
-    SensorEntityDescription(
+    PolycomSensorEntityDescription(
         key="memory_total",
         name="Memory Total",
         icon="mdi:memory",
         native_unit_of_measurement=UnitOfInformation.MEGABYTES,
         device_class=SensorDeviceClass.DATA_SIZE,
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="memory_total",
     ),
-    SensorEntityDescription(
+    PolycomSensorEntityDescription(
         key="last_called_number",
         name="Last Called Number",
         icon="mdi:phone-outgoing",
+        field="last_called_number",
     ),
-    SensorEntityDescription(
+    PolycomSensorEntityDescription(
         key="sip_connection",
         name="SIP Connection",
         icon="mdi:lan-connect",
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="sip_connection",
     ),
-    SensorEntityDescription(
+    PolycomSensorEntityDescription(
         key="uptime",
         name="Uptime",
         icon="mdi:clock-outline",
         device_class=SensorDeviceClass.TIMESTAMP,
         entity_category=EntityCategory.DIAGNOSTIC,
+        field="boot_time",
+    ),
+    PolycomSensorEntityDescription(
+        key="calls_today",
+        name="Calls Today",
+        icon="mdi:phone-log",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        field="calls_today",
+    ),
+    PolycomSensorEntityDescription(
+        key="missed_calls_today",
+        name="Missed Calls Today",
+        icon="mdi:phone-missed",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        field="missed_calls_today",
+    ),
+    PolycomSensorEntityDescription(
+        key="talk_time_today",
+        name="Talk Time Today",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.MINUTES,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        field="talk_time_today",
+    ),
+    PolycomSensorEntityDescription(
+        key="average_call_duration",
+        name="Average Call Duration",
+        icon="mdi:timer-sand",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.MINUTES,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        field="average_call_duration",
+    ),
+    PolycomSensorEntityDescription(
+        key="last_call_codec",
+        name="Last Call Codec",
+        icon="mdi:waveform",
+        field="last_call_codec",
+    ),
+    PolycomSensorEntityDescription(
+        key="last_call_jitter",
+        name="Last Call Jitter",
+        icon="mdi:chart-bell-curve",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        field="last_call_jitter",
+    ),
+    PolycomSensorEntityDescription(
+        key="last_call_latency",
+        name="Last Call Latency",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        field="last_call_latency",
+    ),
+    PolycomSensorEntityDescription(
+        key="last_call_packet_loss",
+        name="Last Call Packet Loss",
+        icon="mdi:lan-disconnect",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        field="last_call_packet_loss",
+    ),
+    PolycomSensorEntityDescription(
+        key="poll_latency_p95",
+        name="Poll Latency p95",
+        icon="mdi:timer-sand",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        field="poll_latency_p95",
+    ),
+    PolycomSensorEntityDescription(
+        key="failed_endpoints",
+        name="Failed Endpoints",
+        icon="mdi:api-off",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        field="failed_endpoints",
+    ),
+)
+
+
+# Counters of PolycomFleetStatus, provided by the hosting entry
+FLEET_ENTITY_DESCRIPTIONS = (
+    SensorEntityDescription(
+        key="devices",
+        name="Polycom Fleet Devices",
+        icon="mdi:phone-classic",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="offline",
+        name="Polycom Fleet Offline",
+        icon="mdi:phone-off",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="unregistered",
+        name="Polycom Fleet Unregistered",
+        icon="mdi:phone-alert",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="in_call",
+        name="Polycom Fleet In Call",
+        icon="mdi:phone-in-talk",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="do_not_disturb",
+        name="Polycom Fleet Do Not Disturb",
+        icon="mdi:minus-circle",
+        state_class=SensorStateClass.MEASUREMENT,
     ),
 )
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    hass: HomeAssistant,
     entry: PolycomConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensor platform."""
+    coordinator = entry.runtime_data.coordinator
+    # Imported as long-term statistics instead of recorded as states
+    skipped = LONG_TERM_STATISTICS if coordinator.statistics is not None else {}
     async_add_entities(
         PolycomSensor(
-            coordinator=entry.runtime_data.coordinator,
+            coordinator=coordinator,
             entity_description=entity_description,
         )
         for entity_description in ENTITY_DESCRIPTIONS
+        if entity_description.key not in skipped
     )
 
+    fleet_status = async_get_fleet_status(hass)
+    if fleet_status.claim_host(entry.entry_id):
+        async_add_entities(
+            PolycomFleetSensor(fleet_status, entity_description)
+            for entity_description in FLEET_ENTITY_DESCRIPTIONS
+        )
+
 
 class PolycomSensor(PolycomEntity, SensorEntity):
     """polycom_speakerphone Sensor class."""
@@ -113,143 +268,57 @@ class PolycomSensor(PolycomEntity, SensorEntity):
     def __init__(
         self,
         coordinator: PolycomDataUpdateCoordinator,
-        entity_description: SensorEntityDescription,
+        entity_description: PolycomSensorEntityDescription,
     ) -> None:
         """Initialize the sensor class."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, entity_description.field)
         self.entity_description = entity_description
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{entity_description.key}"
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{entity_description.key}"
+        )
 
     @property
     def native_value(self) -> str | int | float | datetime | None:
         """Return the native value of the sensor."""
-        data = self.coordinator.data
-        key = self.entity_description.key
-        
-        if key == "phone_state":
-            # Use pollForStatus for real-time phone state
-            poll_status = data.get("poll_status", {})
-            if isinstance(poll_status, dict):
-                state = poll_status.get("State")
-                if state:
-                    return state
-            # Fallback to old call_status endpoint
-            call_status = data.get("call_status", {})
-            if isinstance(call_status, dict):
-                return call_status.get("State", "Idle")
-            return "Idle"
-        
-        if key == "last_call_time":
-            poll_status = data.get("poll_status", {})
-            if isinstance(poll_status, dict):
-                state_data = poll_status.get("StateData", "")
-                # Parse "Time of last call 2025-08-03T10:35:57"
-                if state_data and "Time of last call" in state_data:
-                    try:
-                        timestamp_str = state_data.split("Time of last call ")[-1].strip()
-                        # Parse ISO format timestamp and make timezone-aware using HA's timezone
-                        dt = datetime.fromisoformat(timestamp_str)
-                        # If no timezone info, assume it's in Home Assistant's configured timezone
-                        if dt.tzinfo is None:
-                            dt = dt_util.as_local(dt)
-                        return dt
-                    except (ValueError, IndexError):
-                        pass
-            return None
-        
-        if key == "call_duration":
-            poll_status = data.get("poll_status", {})
-            if isinstance(poll_status, dict):
-                state_data = poll_status.get("StateData", "")
-                # Parse duration if available (format TBD based on active call)
-                if state_data and "duration" in state_data.lower():
-                    return state_data
-            return None
-        
-        if key == "phone_error":
-            poll_status = data.get("poll_status", {})
-            if isinstance(poll_status, dict):
-                state_data = poll_status.get("StateData", "")
-                # Check if StateData contains error information
-                if state_data and ("error" in state_data.lower() or "fail" in state_data.lower()):
-                    return state_data
-            return None
-        
-        if key == "cpu_usage":
-            device_stats = data.get("device_stats", {})
-            if isinstance(device_stats, dict):
-                cpu = device_stats.get("CPU", {})
-                if isinstance(cpu, dict):
-                    current = cpu.get("Current")
-                    if current:
-                        try:
-                            return float(current)
-                        except (ValueError, TypeError):
-                            pass
-            return None
-        
-        if key == "memory_usage":
-            device_stats = data.get("device_stats", {})
-            if isinstance(device_stats, dict):
-                memory = device_stats.get("Memory", {})
-                if isinstance(memory, dict):
-                    try:
-                        total = int(memory.get("Total", 0))
-                        used = int(memory.get("Used", 0))
-                        if total > 0:
-                            return round((used / total) * 100, 1)
-                    except (ValueError, TypeError):
-                        pass
-            return None
-        
-        if key == "memory_total":
-            device_stats = data.get("device_stats", {})
-            if isinstance(device_stats, dict):
-                memory = device_stats.get("Memory", {})
-                if isinstance(memory, dict):
-                    try:
-                        total = int(memory.get("Total", 0))
-                        # Convert bytes to MB
-                        return round(total / (1024 * 1024), 1)
-                    except (ValueError, TypeError):
-                        pass
-            return None
-        
-        if key == "last_called_number":
-            session_stats = data.get("session_stats", {})
-            if isinstance(session_stats, dict):
-                return session_stats.get("LastCalledNumber")
-            return None
-        
-        if key == "sip_connection":
-            line_info = data.get("line_info", [])
-            if isinstance(line_info, list) and len(line_info) > 0:
-                call_servers = line_info[0].get("CallServers", [])
-                if isinstance(call_servers, list) and len(call_servers) > 0:
-                    working = call_servers[0].get("Working", "False")
-                    return "Connected" if working == "True" else "Disconnected"
-            return "Unknown"
-        
-        if key == "uptime":
-            device_info = data.get("device_info", {})
-            if isinstance(device_info, dict):
-                uptime_data = device_info.get("UpTime", {})
-                if isinstance(uptime_data, dict):
-                    try:
-                        # Convert uptime components to total seconds
-                        days = int(uptime_data.get("Days", 0))
-                        hours = int(uptime_data.get("Hours", 0))
-                        minutes = int(uptime_data.get("Minutes", 0))
-                        seconds = int(uptime_data.get("Seconds", 0))
-                        
-                        total_seconds = (days * 86400) + (hours * 3600) + (minutes * 60) + seconds
-                        
-                        # Calculate device start time by subtracting uptime from now
-                        if total_seconds > 0:
-                            now = dt_util.now()
-                            return (now - timedelta(seconds=total_seconds)).replace(microsecond=0)
-                    except (ValueError, TypeError):
-                        pass
-            return None
-        
-        return None
+        return self._value_fn(self.coordinator.snapshot)
+
+
+class PolycomFleetSensor(SensorEntity):
+    """Counter across every phone, on a device of its own."""
+
+    _attr_attribution = ATTRIBUTION
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        fleet_status: PolycomFleetStatus,
+        entity_description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        self.entity_description = entity_description
+        self._fleet_status = fleet_status
+        self._attr_unique_id = f"{DOMAIN}_fleet_{entity_description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, "fleet")},
+            name="Polycom Fleet",
+            manufacturer="Polycom",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the fleet counters."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._fleet_status.async_add_listener(self._handle_fleet_update)
+        )
+
+    @callback
+    def _handle_fleet_update(self, changed: frozenset[str]) -> None:
+        """Write state only if this sensor's counter changed."""
+        if self.entity_description.key in changed:
+            self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> int:
+        """Return the native value of the sensor."""
+        return self._fleet_status.counters[self.entity_description.key]
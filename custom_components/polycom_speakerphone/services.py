@@ -0,0 +1,107 @@
+"""Services for polycom_speakerphone."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import (
+    ATTR_AREA_ID,
+    ATTR_DEVICE_ID,
+    ATTR_ENTITY_ID,
+    ATTR_FLOOR_ID,
+    ATTR_LABEL_ID,
+)
+from homeassistant.core import SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.service import async_extract_config_entry_ids
+
+from .const import (
+    DEFAULT_REBOOT_CONCURRENCY,
+    DEFAULT_REBOOT_IDLE_TIMEOUT,
+    DEFAULT_REBOOT_MAX_FAILURES,
+    DEFAULT_REBOOT_ONLINE_TIMEOUT,
+    DOMAIN,
+    SERVICE_REBOOT,
+)
+from .reboot import PolycomRollingReboot, RollingRebootOptions
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+ATTR_ALL = "all"
+ATTR_CONCURRENCY = "concurrency"
+ATTR_MAX_FAILURES = "max_failures"
+ATTR_IDLE_TIMEOUT = "idle_timeout"
+ATTR_ONLINE_TIMEOUT = "online_timeout"
+
+TARGET_FIELDS = (
+    ATTR_AREA_ID,
+    ATTR_DEVICE_ID,
+    ATTR_ENTITY_ID,
+    ATTR_FLOOR_ID,
+    ATTR_LABEL_ID,
+)
+
+REBOOT_SCHEMA = vol.Schema(
+    {
+        **cv.TARGET_SERVICE_FIELDS,
+        vol.Optional(ATTR_ALL, default=False): cv.boolean,
+        vol.Optional(ATTR_CONCURRENCY, default=DEFAULT_REBOOT_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=50)
+        ),
+        vol.Optional(ATTR_MAX_FAILURES, default=DEFAULT_REBOOT_MAX_FAILURES): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(ATTR_IDLE_TIMEOUT, default=DEFAULT_REBOOT_IDLE_TIMEOUT): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Optional(
+            ATTR_ONLINE_TIMEOUT, default=DEFAULT_REBOOT_ONLINE_TIMEOUT
+        ): vol.All(vol.Coerce(float), vol.Range(min=30)),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services, once for all phones."""
+
+    async def async_handle_reboot(call: ServiceCall) -> ServiceResponse:
+        """Reboot the targeted phones, or every phone when asked to."""
+        entries = [
+            entry
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if entry.state is ConfigEntryState.LOADED
+        ]
+        if not call.data[ATTR_ALL]:
+            # Rebooting the whole fleet has to be asked for explicitly
+            if not any(field in call.data for field in TARGET_FIELDS):
+                msg = "Target the phones to reboot, or set all to reboot every phone"
+                raise ServiceValidationError(msg)
+            targeted = await async_extract_config_entry_ids(hass, call)
+            entries = [entry for entry in entries if entry.entry_id in targeted]
+        if not entries:
+            msg = "No loaded Polycom phones match the target"
+            raise ServiceValidationError(msg)
+
+        results = await PolycomRollingReboot(
+            entries,
+            RollingRebootOptions(
+                concurrency=call.data[ATTR_CONCURRENCY],
+                max_failures=call.data[ATTR_MAX_FAILURES],
+                idle_timeout=call.data[ATTR_IDLE_TIMEOUT],
+                online_timeout=call.data[ATTR_ONLINE_TIMEOUT],
+            ),
+        ).async_run()
+        return {"results": results}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REBOOT,
+        async_handle_reboot,
+        schema=REBOOT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,219 @@
+"""Decoded device snapshot for polycom_speakerphone."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from .history import PolycomCallHistory
+    from .metrics import PolycomClientMetrics
+    from .quality import CallQuality
+
+
+def _phone_state(poll_status: Any, call_status: Any) -> str:
+    """Decode the phone state, preferring the real-time pollForStatus."""
+    if isinstance(poll_status, dict) and (state := poll_status.get("State")):
+        return state
+    # Fallback to old call_status endpoint
+    if isinstance(call_status, dict):
+        return call_status.get("State", "Idle")
+    return "Idle"
+
+
+def _last_call_time(state_data: str) -> datetime | None:
+    """Decode "Time of last call 2025-08-03T10:35:57" from StateData."""
+    if "Time of last call" not in state_data:
+        return None
+    try:
+        timestamp_str = state_data.split("Time of last call ")[-1].strip()
+        dt = datetime.fromisoformat(timestamp_str)
+    except (ValueError, IndexError):
+        return None
+    # If no timezone info, assume it's in Home Assistant's configured timezone
+    if dt.tzinfo is None:
+        dt = dt_util.as_local(dt)
+    return dt
+
+
+def decode_cpu_usage(device_stats: dict[str, Any]) -> float | None:
+    """Decode the current CPU usage."""
+    cpu = device_stats.get("CPU", {})
+    if not isinstance(cpu, dict) or not (current := cpu.get("Current")):
+        return None
+    try:
+        return float(current)
+    except (ValueError, TypeError):
+        return None
+
+
+def decode_memory(device_stats: dict[str, Any]) -> tuple[float | None, float | None]:
+    """Decode memory usage (percent) and total memory (MB)."""
+    memory = device_stats.get("Memory", {})
+    if not isinstance(memory, dict):
+        return None, None
+    try:
+        total = int(memory.get("Total", 0))
+        used = int(memory.get("Used", 0))
+    except (ValueError, TypeError):
+        return None, None
+    usage = round((used / total) * 100, 1) if total > 0 else None
+    # Convert bytes to MB
+    return usage, round(total / (1024 * 1024), 1)
+
+
+def _sip_connection(line: dict[str, Any] | None) -> str:
+    """Decode the SIP server connection of the first line."""
+    if line is None:
+        return "Unknown"
+    call_servers = line.get("CallServers", [])
+    if not isinstance(call_servers, list) or not call_servers:
+        return "Unknown"
+    working = call_servers[0].get("Working", "False")
+    return "Connected" if working == "True" else "Disconnected"
+
+
+def _p95(call_quality: CallQuality, metric: str) -> float | None:
+    """Return the rounded p95 of a call quality metric."""
+    if (aggregate := call_quality.metrics.get(metric)) is None:
+        return None
+    return round(aggregate["p95"], 1)
+
+
+class PolycomSnapshot:
+    """
+    One coordinator refresh, decoded once.
+
+    Entities read plain attributes from here instead of walking the raw
+    endpoint payloads on every state write.
+    """
+
+    __slots__ = (
+        "average_call_duration",
+        "boot_time",
+        "call_duration",
+        "calls_today",
+        "cpu_usage",
+        "do_not_disturb",
+        "failed_endpoints",
+        "last_call_codec",
+        "last_call_jitter",
+        "last_call_latency",
+        "last_call_packet_loss",
+        "last_call_time",
+        "last_called_number",
+        "line_active",
+        "line_registered",
+        "memory_total",
+        "memory_usage",
+        "missed_calls_today",
+        "muted",
+        "phone_error",
+        "phone_state",
+        "poll_latency_p95",
+        "sip_connection",
+        "talk_time_today",
+    )
+
+    def __init__(
+        self,
+        data: dict[str, Any],
+        boot_time: datetime | None,
+        metrics: PolycomClientMetrics | None = None,
+        history: PolycomCallHistory | None = None,
+        call_quality: CallQuality | None = None,
+    ) -> None:
+        """Decode the raw endpoint payloads of a refresh."""
+        poll_status = data.get("poll_status", {})
+        self.phone_state: str = _phone_state(poll_status, data.get("call_status", {}))
+
+        state_data = ""
+        if isinstance(poll_status, dict):
+            state_data = poll_status.get("StateData", "") or ""
+        lowered = state_data.lower()
+        self.last_call_time: datetime | None = _last_call_time(state_data)
+        # Parse duration if available (format TBD based on active call)
+        self.call_duration: str | None = state_data if "duration" in lowered else None
+        self.phone_error: str | None = (
+            state_data if "error" in lowered or "fail" in lowered else None
+        )
+
+        device_stats = data.get("device_stats", {})
+        if not isinstance(device_stats, dict):
+            device_stats = {}
+        self.cpu_usage: float | None = decode_cpu_usage(device_stats)
+        self.memory_usage: float | None
+        self.memory_total: float | None
+        self.memory_usage, self.memory_total = decode_memory(device_stats)
+
+        session_stats = data.get("session_stats", {})
+        self.last_called_number: str | None = (
+            session_stats.get("LastCalledNumber")
+            if isinstance(session_stats, dict)
+            else None
+        )
+
+        line_info = data.get("line_info", [])
+        line = line_info[0] if isinstance(line_info, list) and line_info else None
+        self.sip_connection: str = _sip_connection(line)
+        self.do_not_disturb: bool | None = (
+            None if line is None else line.get("DoNotDisturb", "False") == "True"
+        )
+        self.line_registered: bool | None = (
+            None
+            if line is None
+            else line.get("RegistrationStatus", "").lower() == "registered"
+        )
+        self.line_active: bool | None = (
+            None if line is None else line.get("Active", "False") == "True"
+        )
+
+        communication_info = data.get("communication_info", {})
+        self.muted: bool | None = (
+            communication_info.get("PhoneMuteState", "False") == "True"
+            if isinstance(communication_info, dict)
+            else None
+        )
+
+        # Device start time, derived once per boot by the coordinator
+        self.boot_time: datetime | None = boot_time
+
+        # Request health of the API client, in milliseconds and endpoints
+        p95 = metrics.latency_percentile(95) if metrics is not None else None
+        self.poll_latency_p95: float | None = None if p95 is None else p95 * 1000
+        self.failed_endpoints: int | None = (
+            len(metrics.failed_endpoints) if metrics is not None else None
+        )
+
+        # Call statistics, maintained incrementally by the call history
+        self.calls_today: int | None = None
+        self.missed_calls_today: int | None = None
+        self.talk_time_today: int | None = None
+        self.average_call_duration: int | None = None
+        if history is not None:
+            self.calls_today = history.calls_today
+            self.missed_calls_today = history.missed_today
+            self.talk_time_today = round(history.talk_time_today)
+            if (average := history.average_duration) is not None:
+                self.average_call_duration = round(average)
+
+        # Media quality of the last call, as the p95 of its samples
+        self.last_call_codec: str | None = None
+        self.last_call_jitter: float | None = None
+        self.last_call_latency: float | None = None
+        self.last_call_packet_loss: float | None = None
+        if call_quality is not None:
+            self.last_call_codec = call_quality.codec
+            self.last_call_jitter = _p95(call_quality, "jitter")
+            self.last_call_latency = _p95(call_quality, "latency")
+            self.last_call_packet_loss = _p95(call_quality, "packet_loss")
+
+    def changed_fields(self, other: PolycomSnapshot) -> frozenset[str]:
+        """Return the fields whose value differs from ``other``."""
+        return frozenset(
+            name
+            for name in self.__slots__
+            if getattr(self, name) != getattr(other, name)
+        )
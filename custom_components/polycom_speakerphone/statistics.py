@@ -0,0 +1,195 @@
+"""Long-term statistics import for polycom_speakerphone."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+)
+from homeassistant.const import PERCENTAGE
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_utc_time_change
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .const import DOMAIN, LOGGER, STATISTICS_FLUSH_SECOND
+from .snapshot import decode_cpu_usage, decode_memory
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+    from .data import PolycomConfigEntry
+
+# Snapshot fields imported as statistics instead of recorded as sensor states
+LONG_TERM_STATISTICS = {
+    "cpu_usage": "CPU usage",
+    "memory_usage": "Memory usage",
+}
+
+
+@dataclass(slots=True)
+class _HourAggregate:
+    """Running mean, min and max of one metric over one hour."""
+
+    start: datetime
+    count: int = 0
+    total: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the aggregate in a JSON-serializable form."""
+        return {
+            "start": self.start.isoformat(),
+            "count": self.count,
+            "total": self.total,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> _HourAggregate | None:
+        """Rebuild a stored aggregate; None if it is unusable."""
+        if (start := dt_util.parse_datetime(data.get("start", ""))) is None:
+            return None
+        try:
+            return cls(
+                start,
+                int(data["count"]),
+                float(data["total"]),
+                float(data["minimum"]),
+                float(data["maximum"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def statistic(self) -> StatisticData:
+        """Return the hour as a statistics row."""
+        return StatisticData(
+            start=self.start,
+            mean=self.total / self.count,
+            min=self.minimum,
+            max=self.maximum,
+        )
+
+
+class PolycomStatisticsRecorder:
+    """
+    Import a device's CPU and memory usage as hourly long-term statistics.
+
+    Samples only update a running aggregate of the current hour; finished
+    hours are written to the recorder in one batch per metric shortly after
+    each hour ends, instead of one state row per sensor per poll.
+
+    Each hour is imported once, complete: the open hour is persisted with the
+    coordinator's snapshot and resumed after a reload or restart rather than
+    imported early, which would have its row replaced by the rest of the hour.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: PolycomConfigEntry) -> None:
+        """Initialize."""
+        self._hass = hass
+        object_id = slugify(entry.unique_id or entry.entry_id)
+        self._metadata = {
+            key: StatisticMetaData(
+                has_mean=True,
+                has_sum=False,
+                name=f"{entry.title} {name}",
+                source=DOMAIN,
+                statistic_id=f"{DOMAIN}:{object_id}_{key}",
+                unit_of_measurement=PERCENTAGE,
+            )
+            for key, name in LONG_TERM_STATISTICS.items()
+        }
+        self._current: dict[str, _HourAggregate] = {}
+        self._finished: dict[str, list[StatisticData]] = {
+            key: [] for key in LONG_TERM_STATISTICS
+        }
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start the hourly import; the returned callback stops it."""
+        unsub = async_track_utc_time_change(
+            self._hass, self._async_flush, minute=0, second=STATISTICS_FLUSH_SECOND
+        )
+
+        @callback
+        def _stop() -> None:
+            unsub()
+            # The open hour is resumed from the snapshot store
+            self._async_import()
+
+        return _stop
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the hours still being aggregated."""
+        return {key: aggregate.as_dict() for key, aggregate in self._current.items()}
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Resume the hours that were being aggregated before a reload."""
+        for key, stored in data.items():
+            if (
+                key in LONG_TERM_STATISTICS
+                and key not in self._current
+                and (aggregate := _HourAggregate.from_dict(stored)) is not None
+            ):
+                self._current[key] = aggregate
+
+    def add_device_stats(self, device_stats: Any, now: datetime) -> None:
+        """Add the samples of a freshly fetched device_stats payload."""
+        if not isinstance(device_stats, dict):
+            return
+        memory_usage, _ = decode_memory(device_stats)
+        self._add("cpu_usage", decode_cpu_usage(device_stats), now)
+        self._add("memory_usage", memory_usage, now)
+
+    def _add(self, key: str, value: float | None, now: datetime) -> None:
+        """Add one sample to the current hour's aggregate."""
+        if value is None:
+            return
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        aggregate = self._current.get(key)
+        if aggregate is not None and aggregate.start != hour:
+            self._finished[key].append(aggregate.statistic())
+            aggregate = None
+        if aggregate is None:
+            aggregate = self._current[key] = _HourAggregate(hour)
+        aggregate.add(value)
+
+    @callback
+    def _async_flush(self, now: datetime) -> None:
+        """Import the hours that ended before ``now``."""
+        self._close_hours(now.replace(minute=0, second=0, microsecond=0))
+        self._async_import()
+
+    def _close_hours(self, before: datetime) -> None:
+        """Move aggregates of hours starting before ``before`` out."""
+        for key, aggregate in list(self._current.items()):
+            if aggregate.start < before:
+                self._finished[key].append(aggregate.statistic())
+                del self._current[key]
+
+    def _async_import(self) -> None:
+        """Write the finished hours to the recorder, one batch per metric."""
+        if "recorder" not in self._hass.config.components:
+            LOGGER.debug("Recorder not loaded, dropping device statistics")
+            for rows in self._finished.values():
+                rows.clear()
+            return
+        for key, rows in self._finished.items():
+            if rows:
+                async_add_external_statistics(self._hass, self._metadata[key], rows)
+                self._finished[key] = []
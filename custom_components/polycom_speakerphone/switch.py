@@ -2,24 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
+from homeassistant.exceptions import HomeAssistantError
 
+from .api import PolycomApiClientError
+from .const import COMMAND_CONFIRM_DELAY, COMMAND_COOLDOWN, LOGGER
 from .entity import PolycomEntity
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .api import PolycomApiClient
     from .coordinator import PolycomDataUpdateCoordinator
     from .data import PolycomConfigEntry
 
+
+@dataclass(frozen=True, kw_only=True)
+class PolycomSwitchEntityDescription(SwitchEntityDescription):
+    """Describes a Polycom switch."""
+
+    # Snapshot field the state is read from
+    field: str
+    set_fn: Callable[[PolycomApiClient, bool], Awaitable[Any]]
+    # Endpoints that reflect the switch state, re-read to confirm a command
+    state_endpoints: tuple[str, ...]
+
+
 ENTITY_DESCRIPTIONS = (
-    SwitchEntityDescription(
+    PolycomSwitchEntityDescription(
         key="mute",
         name="Mute",
         icon="mdi:microphone-off",
+        field="muted",
+        set_fn=lambda client, state: client.async_set_mute(state),
+        state_endpoints=("communication_info",),
     ),
 )
 
@@ -40,47 +63,81 @@ async def async_setup_entry(
 
 
 class PolycomSwitch(PolycomEntity, SwitchEntity):
-    """polycom_speakerphone Switch class."""
+    """
+    polycom_speakerphone Switch class.
+
+    Changes show optimistically straight away. Changes made within
+    ``COMMAND_COOLDOWN`` of each other are merged into one command for the
+    last requested state, which is then confirmed by re-reading only the
+    switch's ``state_endpoints``; if the device disagrees the switch falls
+    back to the state it reports.
+    """
 
     def __init__(
         self,
         coordinator: PolycomDataUpdateCoordinator,
-        entity_description: SwitchEntityDescription,
+        entity_description: PolycomSwitchEntityDescription,
     ) -> None:
         """Initialize the switch class."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, entity_description.field)
         self.entity_description = entity_description
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{entity_description.key}"
+        # Requested state not yet confirmed by the device
+        self._pending: bool | None = None
+        self._sending = False
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
-        data = self.coordinator.data
-        key = self.entity_description.key
-        
-        if key == "mute":
-            communication_info = data.get("communication_info", {})
-            if isinstance(communication_info, dict):
-                mute_state = communication_info.get("PhoneMuteState", "False")
-                return mute_state == "True"
-            return None
-        
-        return None
+        if self._pending is not None:
+            return self._pending
+        return self._value_fn(self.coordinator.snapshot)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
-        key = self.entity_description.key
-        
-        if key == "mute":
-            client = self.coordinator.config_entry.runtime_data.client
-            await client.async_set_mute(True)
-            await self.coordinator.async_request_refresh()
+        await self._async_set(state=True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
-        key = self.entity_description.key
-        
-        if key == "mute":
-            client = self.coordinator.config_entry.runtime_data.client
-            await client.async_set_mute(False)
-            await self.coordinator.async_request_refresh()
+        await self._async_set(state=False)
+
+    async def _async_set(self, *, state: bool) -> None:
+        """Show the new state, then send it unless a send is under way."""
+        self._pending = state
+        self.async_write_ha_state()
+        if self._sending:
+            # The running send picks the new state up once it is done
+            return
+
+        self._sending = True
+        try:
+            while True:
+                # Let a burst of changes settle into a single command
+                await asyncio.sleep(COMMAND_COOLDOWN)
+                state = self._pending
+                await self._async_send(state)
+                if self._pending == state:
+                    break
+        except PolycomApiClientError as exception:
+            msg = f"Could not set {self.entity_id}: {exception}"
+            raise HomeAssistantError(msg) from exception
+        finally:
+            self._sending = False
+            self._pending = None
+            self.async_write_ha_state()
+
+        if (confirmed := self._value_fn(self.coordinator.snapshot)) != state:
+            LOGGER.warning(
+                "%s reports %s after being set to %s", self.entity_id, confirmed, state
+            )
+
+    async def _async_send(self, state: bool) -> None:  # noqa: FBT001
+        """Send one command and re-read the endpoints that show its result."""
+        client = self.coordinator.config_entry.runtime_data.client
+        endpoints = self.entity_description.state_endpoints
+        await self.entity_description.set_fn(client, state)
+        await self.coordinator.async_refresh_endpoints(endpoints)
+        if self._value_fn(self.coordinator.snapshot) not in (state, None):
+            # Give a device that is slow to apply the command another look
+            await asyncio.sleep(COMMAND_CONFIRM_DELAY)
+            await self.coordinator.async_refresh_endpoints(endpoints)
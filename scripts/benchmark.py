@@ -0,0 +1,323 @@
+"""
+Benchmark refresh cost against simulated Trio phones.
+
+Runs 1-500 fake phones (see ``scripts/fake_trio.py``) through the
+integration's API client or, when Home Assistant is installed, through
+``PolycomDataUpdateCoordinator`` itself, and reports per fleet size:
+
+- requests per refresh
+- p50/p99 refresh latency
+- worst event-loop lag
+- CPU time per entity update (coordinator mode)
+
+    python scripts/benchmark.py --devices 1 10 100 500
+    python scripts/benchmark.py --mode coordinator --devices 10 100 --rounds 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import importlib
+import sys
+import tempfile
+import time
+import types
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "custom_components"))
+
+from fake_trio import (
+    FakeTrioConfig,
+    FakeTrioFleet,
+    create_ssl_context,
+    parse_script,
+)
+
+PASSWORD = "password"  # noqa: S105
+
+
+def _load_api() -> Any:
+    """Import the API client, with or without Home Assistant installed."""
+    try:
+        from polycom_speakerphone import api  # noqa: PLC0415
+    except ImportError:
+        # The package __init__ needs Home Assistant; api.py and the modules it
+        # imports do not, so stand in an empty package and import from it
+        path = Path(__file__).parent.parent / "custom_components/polycom_speakerphone"
+        package = types.ModuleType("polycom_speakerphone")
+        package.__path__ = [str(path)]
+        sys.modules[package.__name__] = package
+        api = importlib.import_module("polycom_speakerphone.api")
+    return api
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """Return the nearest-rank percentile of ``values``."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+@dataclass
+class Result:
+    """Measurements for one fleet size."""
+
+    devices: int
+    refreshes: int = 0
+    requests: int = 0
+    latencies: list[float] = field(default_factory=list)
+    loop_lag: float = 0.0
+    cpu_time: float = 0.0
+    entity_updates: int = 0
+    entity_cpu_time: float = 0.0
+
+    def row(self) -> str:
+        """Format the result as a table row."""
+        per_entity = (
+            f"{self.entity_cpu_time / self.entity_updates * 1e6:10.1f}"
+            if self.entity_updates
+            else f"{'-':>10}"
+        )
+        return (
+            f"{self.devices:>7} {self.requests / max(self.refreshes, 1):>9.2f} "
+            f"{_percentile(self.latencies, 50) * 1000:>9.1f} "
+            f"{_percentile(self.latencies, 99) * 1000:>9.1f} "
+            f"{self.loop_lag * 1000:>9.1f} {self.cpu_time:>8.2f} {per_entity}"
+        )
+
+
+HEADER = (
+    f"{'devices':>7} {'req/ref':>9} {'p50 ms':>9} {'p99 ms':>9} "
+    f"{'lag ms':>9} {'cpu s':>8} {'us/entity':>10}"
+)
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop runs a short, repeating sleep."""
+
+    def __init__(self, interval: float = 0.01) -> None:
+        """Initialize."""
+        self.interval = interval
+        self.worst = 0.0
+        self._task: asyncio.Task[None] | None = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.worst = max(self.worst, loop.time() - start - self.interval)
+
+    def start(self) -> None:
+        """Start measuring."""
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop measuring."""
+        if self._task:
+            self._task.cancel()
+
+
+async def _timed(coroutine: Any, latencies: list[float]) -> None:
+    """Await ``coroutine`` and record how long it took."""
+    start = time.monotonic()
+    # A failed refresh still counts towards latency; errors are simulated
+    with contextlib.suppress(Exception):
+        await coroutine
+    latencies.append(time.monotonic() - start)
+
+
+async def bench_client(
+    fleet: FakeTrioFleet, rounds: int, tick: float, result: Result
+) -> None:
+    """Refresh every phone with async_get_all_data, ``rounds`` times."""
+    api = _load_api()
+    sessions = []
+    clients = []
+    for host in fleet.hosts:
+        session, _stats = api.create_device_session()
+        sessions.append(session)
+        clients.append(
+            api.PolycomApiClient(
+                host=host, username="Polycom", password=PASSWORD, session=session
+            )
+        )
+
+    try:
+        for _ in range(rounds):
+            await asyncio.gather(
+                *(
+                    _timed(client.async_get_all_data(), result.latencies)
+                    for client in clients
+                )
+            )
+            result.refreshes += len(clients)
+            await asyncio.sleep(tick)
+    finally:
+        for session in sessions:
+            await session.close()
+
+
+async def bench_coordinator(
+    fleet: FakeTrioFleet, rounds: int, tick: float, result: Result
+) -> None:
+    """Refresh every phone through its own coordinator, ``rounds`` times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import config_entries  # noqa: PLC0415
+    from homeassistant.core import HomeAssistant  # noqa: PLC0415
+    from homeassistant.helpers import device_registry as dr  # noqa: PLC0415
+    from polycom_speakerphone.api import (  # noqa: PLC0415
+        PolycomApiClient,
+        create_device_session,
+    )
+    from polycom_speakerphone.binary_sensor import (  # noqa: PLC0415
+        ENTITY_DESCRIPTIONS as BINARY_SENSORS,
+    )
+    from polycom_speakerphone.const import DOMAIN, LOGGER  # noqa: PLC0415
+    from polycom_speakerphone.coordinator import (  # noqa: PLC0415
+        PolycomDataUpdateCoordinator,
+    )
+    from polycom_speakerphone.data import PolycomData  # noqa: PLC0415
+    from polycom_speakerphone.sensor import (  # noqa: PLC0415
+        ENTITY_DESCRIPTIONS as SENSORS,
+    )
+    from polycom_speakerphone.snapshot import PolycomSnapshot  # noqa: PLC0415
+    from polycom_speakerphone.switch import (  # noqa: PLC0415
+        ENTITY_DESCRIPTIONS as SWITCHES,
+    )
+
+    descriptions = (*SENSORS, *BINARY_SENSORS, *SWITCHES)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await dr.async_load(hass)
+
+        coordinators = []
+        sessions = []
+        for host in fleet.hosts:
+            entry = config_entries.ConfigEntry(
+                data={"host": host, "password": PASSWORD},
+                discovery_keys=MappingProxyType({}),
+                domain=DOMAIN,
+                minor_version=1,
+                options={},
+                source=config_entries.SOURCE_USER,
+                title=host,
+                unique_id=None,
+                version=1,
+            )
+            session, stats = create_device_session()
+            sessions.append(session)
+            coordinator = PolycomDataUpdateCoordinator(
+                hass=hass,
+                logger=LOGGER,
+                name=DOMAIN,
+                config_entry=entry,
+                update_interval=None,
+            )
+            entry.runtime_data = PolycomData(
+                client=PolycomApiClient(
+                    host=host, username="Polycom", password=PASSWORD, session=session
+                ),
+                connection_stats=stats,
+                coordinator=coordinator,
+                integration=None,
+                device_info={},
+                mac_address="",
+                host=host,
+            )
+            coordinators.append(coordinator)
+
+        previous: list[PolycomSnapshot | None] = [None] * len(coordinators)
+        try:
+            for _ in range(rounds):
+                await asyncio.gather(
+                    *(
+                        _timed(coordinator.async_refresh(), result.latencies)
+                        for coordinator in coordinators
+                    )
+                )
+                result.refreshes += len(coordinators)
+
+                # What the entities do on a coordinator update: decode, diff,
+                # and build the state of each entity whose fields changed
+                start = time.process_time()
+                for index, coordinator in enumerate(coordinators):
+                    if coordinator.data is None:
+                        continue
+                    snapshot = PolycomSnapshot(coordinator.data, coordinator.boot_time)
+                    changed = (
+                        None
+                        if previous[index] is None
+                        else snapshot.changed_fields(previous[index])
+                    )
+                    previous[index] = snapshot
+                    for description in descriptions:
+                        if changed is None or description.field in changed:
+                            getattr(snapshot, description.field)
+                            result.entity_updates += 1
+                result.entity_cpu_time += time.process_time() - start
+
+                await asyncio.sleep(tick)
+        finally:
+            for session in sessions:
+                await session.close()
+            await hass.async_stop(force=True)
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the benchmark for every requested fleet size."""
+    config = FakeTrioConfig(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        missing_endpoints=frozenset(args.missing),
+        script=parse_script(args.script),
+        password=PASSWORD,
+    )
+    bench = bench_coordinator if args.mode == "coordinator" else bench_client
+
+    print(HEADER)  # noqa: T201
+    with tempfile.TemporaryDirectory() as directory:
+        ssl_context = create_ssl_context(Path(directory))
+        for count in args.devices:
+            fleet = FakeTrioFleet(count, config, ssl_context=ssl_context)
+            await fleet.start()
+            result = Result(devices=count)
+            monitor = LoopLagMonitor()
+            monitor.start()
+            cpu_start = time.process_time()
+            try:
+                await bench(fleet, args.rounds, args.tick, result)
+            finally:
+                monitor.stop()
+                await fleet.stop()
+            result.cpu_time = time.process_time() - cpu_start
+            result.loop_lag = monitor.worst
+            result.requests = fleet.total_requests
+            print(result.row())  # noqa: T201
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mode", choices=("client", "coordinator"), default="client")
+    parser.add_argument("--devices", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--tick", type=float, default=2.0)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--missing", nargs="*", default=[])
+    parser.add_argument("--script", default="Idle:20,Ringing:4,Active:30")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""
+Local stand-in for Polycom Trio phones.
+
+Serves every REST path the integration's API client uses, one listening port
+per simulated phone, with configurable latency, error rate, missing
+endpoints and a scripted call-state cycle. Used by ``scripts/benchmark.py``
+and handy for developing against without real hardware:
+
+    python scripts/fake_trio.py --devices 3 --script Idle:20,Ringing:4,Active:30
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import random
+import ssl
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+
+# Path -> endpoint name, mirroring custom_components/polycom_speakerphone/api.py
+ENDPOINT_PATHS = {
+    "/api/v2/mgmt/device/info": "device_info",
+    "/api/v1/mgmt/network/info": "network_info",
+    "/api/v1/mgmt/pollForStatus": "poll_status",
+    "/api/v1/webCallControl/callStatus": "call_status",
+    "/api/v1/mgmt/device/stats": "device_stats",
+    "/api/v2/mgmt/lineInfo": "line_info",
+    "/api/v1/mgmt/media/sessionStats": "session_stats",
+    "/api/v1/mgmt/media/communicationInfo": "communication_info",
+    "/api/v1/callctrl/mute": "mute",
+    "/api/v1/mgmt/safeReboot": "reboot",
+}
+
+MEMORY_TOTAL = 512 * 1024 * 1024
+
+
+def parse_script(script: str) -> list[tuple[str, float]]:
+    """Parse "Idle:20,Ringing:4,Active:30" into (state, seconds) steps."""
+    steps = []
+    for step in script.split(","):
+        state, _, seconds = step.partition(":")
+        steps.append((state.strip(), float(seconds or 0)))
+    return steps
+
+
+@dataclass
+class FakeTrioConfig:
+    """Behaviour shared by every simulated phone."""
+
+    latency: float = 0.05
+    latency_jitter: float = 0.02
+    error_rate: float = 0.0
+    missing_endpoints: frozenset[str] = frozenset()
+    script: list[tuple[str, float]] = field(default_factory=lambda: [("Idle", 60.0)])
+    password: str = "password"  # noqa: S105
+    reboot_downtime: float = 5.0
+
+
+class FakeTrio:
+    """One simulated phone."""
+
+    def __init__(self, index: int, config: FakeTrioConfig) -> None:
+        """Initialize."""
+        self.index = index
+        self.config = config
+        self.mac_address = f"0004f2{index:06x}"
+        self.requests: dict[str, int] = dict.fromkeys(ENDPOINT_PATHS.values(), 0)
+        self.muted = False
+        self._authorization = aiohttp.BasicAuth("Polycom", config.password).encode()
+        self._booted_at = time.monotonic() - random.uniform(3600, 86400)  # noqa: S311
+        self._down_until = 0.0
+        self._script_duration = sum(seconds for _, seconds in config.script) or 1
+        # Spread the phones over the call script so they do not ring in step
+        self._script_offset = random.uniform(0, self._script_duration)  # noqa: S311
+
+    @property
+    def total_requests(self) -> int:
+        """Return how many requests the phone has answered."""
+        return sum(self.requests.values())
+
+    @property
+    def state(self) -> str:
+        """Return the current scripted phone state."""
+        position = (time.monotonic() + self._script_offset) % self._script_duration
+        for state, seconds in self.config.script:
+            if position < seconds:
+                return state
+            position -= seconds
+        return self.config.script[-1][0]
+
+    def _uptime(self) -> dict[str, int]:
+        seconds = int(time.monotonic() - self._booted_at)
+        days, seconds = divmod(seconds, 86400)
+        hours, seconds = divmod(seconds, 3600)
+        minutes, seconds = divmod(seconds, 60)
+        return {"Days": days, "Hours": hours, "Minutes": minutes, "Seconds": seconds}
+
+    def payload(self, endpoint: str) -> Any:  # noqa: PLR0911
+        """Return the data member of an endpoint's response."""
+        state = self.state
+        if endpoint == "device_info":
+            return {
+                "ModelNumber": "Trio 8800",
+                "DeviceVendor": "Polycom",
+                "MACAddress": self.mac_address,
+                "Firmware": {"Application": "7.2.1.0780"},
+                "UpTime": self._uptime(),
+            }
+        if endpoint == "network_info":
+            return {"MACAddress": self.mac_address, "IPV4Address": "127.0.0.1"}
+        if endpoint == "poll_status":
+            return {
+                "State": state,
+                "StateData": "Time of last call 2025-08-03T10:35:57",
+            }
+        if endpoint == "call_status":
+            return {"State": state}
+        if endpoint == "device_stats":
+            used = int(MEMORY_TOTAL * random.uniform(0.4, 0.6))  # noqa: S311
+            return {
+                "CPU": {"Current": f"{random.uniform(5, 40):.1f}"},  # noqa: S311
+                "Memory": {"Total": str(MEMORY_TOTAL), "Used": str(used)},
+            }
+        if endpoint == "line_info":
+            return [
+                {
+                    "RegistrationStatus": "Registered",
+                    "DoNotDisturb": "False",
+                    "Active": "True",
+                    "CallServers": [{"Working": "True"}],
+                }
+            ]
+        if endpoint == "session_stats":
+            return {"LastCalledNumber": f"10{self.index:02d}"}
+        if endpoint == "communication_info":
+            return {"PhoneMuteState": "True" if self.muted else "False"}
+        return {}
+
+    async def handle(self, request: web.Request) -> web.Response:  # noqa: PLR0911
+        """Answer one request like a Trio would."""
+        if (endpoint := ENDPOINT_PATHS.get(request.path)) is None:
+            return web.Response(status=404)
+        self.requests[endpoint] += 1
+        if endpoint in self.config.missing_endpoints:
+            return web.Response(status=404)
+
+        if time.monotonic() < self._down_until:
+            # Rebooting: drop the connection like a phone that is not there
+            request.transport.close()
+            return web.Response(status=503)
+
+        if request.headers.get("Authorization") != self._authorization:
+            return web.Response(
+                status=401,
+                headers={"WWW-Authenticate": 'Basic realm="PolycomSPIP"'},
+            )
+
+        await asyncio.sleep(
+            max(
+                0,
+                random.gauss(self.config.latency, self.config.latency_jitter),
+            )
+        )
+        if random.random() < self.config.error_rate:  # noqa: S311
+            return web.Response(status=500)
+
+        if endpoint == "mute":
+            body = await request.json()
+            self.muted = body["data"]["state"] == "1"
+            return web.json_response({"Status": "2000"})
+        if endpoint == "reboot":
+            self._booted_at = self._down_until = (
+                time.monotonic() + self.config.reboot_downtime
+            )
+            return web.json_response({"Status": "2000"})
+        return web.json_response({"data": self.payload(endpoint), "Status": "2000"})
+
+
+def create_ssl_context(directory: Path) -> ssl.SSLContext:
+    """Create a server context with a throwaway self-signed certificate."""
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(  # noqa: S603
+        [  # noqa: S607
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-days",
+            "1",
+            "-subj",
+            "/CN=fake-trio",
+            "-keyout",
+            str(key),
+            "-out",
+            str(cert),
+        ],
+        check=True,
+        capture_output=True,
+    )
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert, key)
+    return context
+
+
+class FakeTrioFleet:
+    """A set of simulated phones, each listening on its own port."""
+
+    def __init__(
+        self,
+        count: int,
+        config: FakeTrioConfig,
+        base_port: int = 0,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        """Initialize."""
+        self.devices = [FakeTrio(index, config) for index in range(count)]
+        self.hosts: list[str] = []
+        self._base_port = base_port
+        self._ssl_context = ssl_context
+        self._runners: list[web.AppRunner] = []
+
+    @property
+    def total_requests(self) -> int:
+        """Return how many requests the fleet has answered."""
+        return sum(device.total_requests for device in self.devices)
+
+    async def start(self) -> None:
+        """Start listening."""
+        for device in self.devices:
+            app = web.Application()
+            app.router.add_route("*", "/{tail:.*}", device.handle)
+            runner = web.AppRunner(app, access_log=None)
+            await runner.setup()
+            port = self._base_port + device.index if self._base_port else 0
+            site = web.TCPSite(runner, "127.0.0.1", port, ssl_context=self._ssl_context)
+            await site.start()
+            port = runner.addresses[0][1]
+            self.hosts.append(f"127.0.0.1:{port}")
+            self._runners.append(runner)
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        for runner in self._runners:
+            await runner.cleanup()
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    config = FakeTrioConfig(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        missing_endpoints=frozenset(args.missing),
+        script=parse_script(args.script),
+        password=args.password,
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        fleet = FakeTrioFleet(
+            args.devices, config, args.port, create_ssl_context(Path(directory))
+        )
+        await fleet.start()
+        for device, host in zip(fleet.devices, fleet.hosts, strict=True):
+            print(f"{device.mac_address} https://{host}")  # noqa: T201
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await fleet.stop()
+
+
+def main() -> None:
+    """Run simulated phones until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--devices", type=int, default=1)
+    parser.add_argument("--port", type=int, default=9443)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--missing",
+        nargs="*",
+        default=[],
+        choices=sorted(set(ENDPOINT_PATHS.values())),
+    )
+    parser.add_argument("--script", default="Idle:60")
+    parser.add_argument("--password", default="password")
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_serve(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()